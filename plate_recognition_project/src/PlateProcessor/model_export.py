@@ -0,0 +1,248 @@
+"""
+YOLO Model Export
+-----------------
+
+One-time build step that converts the trained YOLOv8 weights (best.pt) into
+an optimized inference artifact stored next to them in src/models/.
+
+    * TensorRT engine (GPU hosts): FP16, dynamic batch up to 8.
+    * TensorRT INT8 engine (GPU hosts): calibrated on representative plate images.
+      Engines are named after the GPU they were built on (best.<gpu>.engine) and
+      are only picked up on a matching GPU.
+    * ONNX graph (CPU-only hosts): dynamic axes, run through onnxruntime.
+    * ONNX INT8 graph (CPU-only hosts): static QDQ quantization with onnxruntime,
+      run by YOLODetector(backend="onnxruntime-int8").
+    * OpenVINO INT8 model (CPU-only hosts): NNCF post-training quantization.
+
+YOLODetector and config/settings.py pick the exported file up automatically
+when it is present, falling back to the .pt weights otherwise.
+
+Usage:
+    python -m PlateProcessor.model_export --format engine
+    python -m PlateProcessor.model_export --format onnx
+    python -m PlateProcessor.model_export --format int8-engine --data datasets/data.yaml
+    python -m PlateProcessor.model_export --format int8-openvino --data datasets/data.yaml
+    python -m PlateProcessor.model_export --format int8-onnx --data datasets/data.yaml
+
+INT8 calibration reads images from the dataset YAML (validation split); a
+few hundred representative plate photos are enough.
+"""
+
+import argparse
+import os
+from typing import List
+
+import cv2
+from ultralytics import YOLO
+
+from PlateProcessor.preprocess import letterbox, bgr_hwc_to_rgb_chw
+from PlateProcessor.yolo_detector import INT8_ONNX_SUFFIX, gpu_tag
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+DEFAULT_WEIGHTS = os.path.join(MODELS_DIR, "best.pt")
+
+
+def export_engine(weights_path: str = DEFAULT_WEIGHTS, imgsz: int = 640, batch: int = 8, device: int = 0) -> str:
+    """
+    Exports YOLO weights to a TensorRT FP16 engine with dynamic batch.
+
+    @param weights_path: Path to the trained .pt weights
+    @param imgsz: Inference image size the engine is optimized for
+    @param batch: Maximum batch size of the dynamic profile
+    @param device: CUDA device index used to build the engine
+    @return: Path of the written .engine file
+    @raises FileNotFoundError: If weights_path does not exist
+    @postcondition: <weights>.<gpu>.engine exists next to the weights
+    """
+    return _export_gpu_engine(weights_path, ".engine", device, imgsz=imgsz, half=True, dynamic=True, batch=batch)
+
+
+def export_onnx(weights_path: str = DEFAULT_WEIGHTS, imgsz: int = 640) -> str:
+    """
+    Exports YOLO weights to an ONNX graph with dynamic axes for CPU inference.
+
+    @param weights_path: Path to the trained .pt weights
+    @param imgsz: Inference image size used for tracing
+    @return: Path of the written .onnx file
+    @raises FileNotFoundError: If weights_path does not exist
+    @postcondition: <weights>.onnx exists next to the weights
+    """
+    if not os.path.exists(weights_path):
+        raise FileNotFoundError(f"YOLO weights not found: {weights_path}")
+
+    model = YOLO(weights_path)
+    return model.export(format="onnx", imgsz=imgsz, dynamic=True, simplify=True)
+
+
+def export_int8_engine(
+    weights_path: str = DEFAULT_WEIGHTS,
+    data: str = "datasets/data.yaml",
+    imgsz: int = 640,
+    batch: int = 8,
+    device: int = 0,
+    workspace: int = 8,
+) -> str:
+    """
+    Exports YOLO weights to a calibrated TensorRT INT8 engine (<weights>.int8.engine).
+
+    @param weights_path: Path to the trained .pt weights
+    @param data: Dataset YAML whose images are used for INT8 calibration
+    @param imgsz: Inference image size the engine is optimized for
+    @param batch: Maximum batch size of the dynamic profile (also the calibration batch)
+    @param device: CUDA device index used to build the engine
+    @param workspace: TensorRT builder workspace in GiB
+    @return: Path of the written .int8.engine file
+    @raises FileNotFoundError: If weights_path does not exist
+    @postcondition: <weights>.<gpu>.int8.engine exists next to the weights
+    """
+    return _export_gpu_engine(
+        weights_path, ".int8.engine", device,
+        imgsz=imgsz, int8=True, data=data, dynamic=True, batch=batch, workspace=workspace,
+    )
+
+
+def _export_gpu_engine(weights_path: str, suffix: str, device: int, **export_kwargs) -> str:
+    """
+    Builds a TensorRT engine and stores it under a name keyed on the GPU model.
+
+    @param weights_path: Path to the trained .pt weights
+    @param suffix: ".engine" or ".int8.engine"
+    @param device: CUDA device index used to build the engine
+    @param export_kwargs: Extra arguments for YOLO.export
+    @return: Path of the written <weights>.<gpu><suffix> file
+    @raises FileNotFoundError: If weights_path does not exist
+    @raises RuntimeError: If no CUDA device is available
+    @postcondition: An existing untagged <weights>.engine is left untouched
+    """
+    if not os.path.exists(weights_path):
+        raise FileNotFoundError(f"YOLO weights not found: {weights_path}")
+    tag = gpu_tag(device)
+    if tag is None:
+        raise RuntimeError("TensorRT export requires a CUDA device")
+
+    root = os.path.splitext(weights_path)[0]
+    default_path, target_path = root + ".engine", f"{root}.{tag}{suffix}"
+
+    # ultralytics always writes <weights>.engine; keep an existing engine out of its way.
+    backup = default_path + ".bak" if os.path.exists(default_path) else None
+    if backup:
+        os.replace(default_path, backup)
+    try:
+        model = YOLO(weights_path)
+        exported = model.export(format="engine", device=device, **export_kwargs)
+        os.replace(exported, target_path)
+    finally:
+        if backup:
+            os.replace(backup, default_path)
+    return target_path
+
+
+def export_int8_openvino(weights_path: str = DEFAULT_WEIGHTS, data: str = "datasets/data.yaml", imgsz: int = 640) -> str:
+    """
+    Exports YOLO weights to an INT8 OpenVINO model for CPU-only hosts.
+
+    @param weights_path: Path to the trained .pt weights
+    @param data: Dataset YAML whose images are used for NNCF calibration
+    @param imgsz: Inference image size
+    @return: Path of the written <weights>_int8_openvino_model directory
+    @raises FileNotFoundError: If weights_path does not exist
+    """
+    if not os.path.exists(weights_path):
+        raise FileNotFoundError(f"YOLO weights not found: {weights_path}")
+
+    model = YOLO(weights_path)
+    return model.export(format="openvino", imgsz=imgsz, int8=True, data=data, dynamic=True)
+
+
+def export_int8_onnx(
+    weights_path: str = DEFAULT_WEIGHTS,
+    data: str = "datasets/data.yaml",
+    imgsz: int = 640,
+    max_images: int = 300,
+) -> str:
+    """
+    Exports YOLO weights to ONNX and statically quantizes it to INT8 (QDQ) with onnxruntime.
+
+    @param weights_path: Path to the trained .pt weights
+    @param data: Dataset YAML whose validation images are used for calibration
+    @param imgsz: Inference image size
+    @param max_images: Maximum number of calibration images
+    @return: Path of the written <weights>.int8.onnx file
+    @raises FileNotFoundError: If weights_path does not exist
+    @raises ValueError: If no calibration images are found
+    """
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+
+    fp32_path = export_onnx(weights_path, imgsz=imgsz)
+    int8_path = os.path.splitext(weights_path)[0] + INT8_ONNX_SUFFIX
+    images = _calibration_images(data, max_images)
+    if not images:
+        raise ValueError(f"No calibration images found for {data}")
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self):
+            self._paths = iter(images)
+
+        def get_next(self):
+            path = next(self._paths, None)
+            if path is None:
+                return None
+            padded, _, _ = letterbox(cv2.imread(path), imgsz)
+            return {"images": bgr_hwc_to_rgb_chw(padded)[None]}
+
+    quantize_static(
+        fp32_path, int8_path, _Reader(),
+        quant_format=QuantFormat.QDQ, per_channel=True,
+        activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8,
+    )
+    return int8_path
+
+
+def _calibration_images(data: str, max_images: int) -> List[str]:
+    """
+    Lists validation images of an ultralytics dataset YAML.
+
+    @param data: Dataset YAML with "path" and "val" (an image directory) keys
+    @param max_images: Maximum number of paths to return
+    @return: Sorted image paths
+    """
+    import yaml  # installed with ultralytics
+
+    with open(data) as f:
+        cfg = yaml.safe_load(f)
+    root = cfg.get("path") or os.path.dirname(os.path.abspath(data))
+    folder = os.path.join(root, cfg["val"])
+    names = sorted(n for n in os.listdir(folder) if n.lower().endswith((".jpg", ".jpeg", ".png")))
+    return [os.path.join(folder, n) for n in names[:max_images]]
+
+
+def _main():  # pragma: no cover
+    """
+    Command-line entry point.
+
+    @postcondition: Prints the path of the exported artifact
+    """
+    parser = argparse.ArgumentParser(description="Export YOLO plate detector for deployment.")
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS, help="Path to trained .pt weights")
+    parser.add_argument("--format", choices=("engine", "onnx", "int8-engine", "int8-openvino", "int8-onnx"), default="engine")
+    parser.add_argument("--data", default="datasets/data.yaml", help="Calibration dataset YAML (INT8 only)")
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--batch", type=int, default=8, help="Max dynamic batch (engine only)")
+    parser.add_argument("--device", type=int, default=0, help="CUDA device (engine only)")
+    args = parser.parse_args()
+
+    if args.format == "engine":
+        path = export_engine(args.weights, imgsz=args.imgsz, batch=args.batch, device=args.device)
+    elif args.format == "int8-engine":
+        path = export_int8_engine(args.weights, data=args.data, imgsz=args.imgsz, batch=args.batch, device=args.device)
+    elif args.format == "int8-openvino":
+        path = export_int8_openvino(args.weights, data=args.data, imgsz=args.imgsz)
+    elif args.format == "int8-onnx":
+        path = export_int8_onnx(args.weights, data=args.data, imgsz=args.imgsz)
+    else:
+        path = export_onnx(args.weights, imgsz=args.imgsz)
+    print(f"INFO: Exported YOLO model to {path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _main()
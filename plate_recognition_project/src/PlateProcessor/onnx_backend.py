@@ -0,0 +1,128 @@
+"""
+ONNX Runtime Detection Backend
+------------------------------
+
+Runs an exported (optionally INT8-quantized) YOLOv8 ONNX graph directly in an
+ONNX Runtime session, for CPU-only hosts where the DNNL execution provider can
+use VNNI int8 kernels.
+
+OnnxDetectionModel mimics the part of the ultralytics model API that
+YOLODetector uses: calling it with an image or a list of images returns one
+result per image whose `boxes.cpu().numpy()` exposes `xyxy`, `cls` and `conf`
+in original image coordinates.
+
+This module uses JavaDoc-style docstrings with @param, @return, and @raises.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+import onnxruntime as ort
+
+from PlateProcessor.preprocess import prepare_batch, unletterbox_boxes
+
+# Execution providers in order of preference; unavailable ones are skipped.
+ONNX_PROVIDERS = ("DnnlExecutionProvider", "CPUExecutionProvider")
+
+
+class _Boxes:
+    """Detections of one image, shaped like ultralytics Boxes after cpu().numpy()."""
+
+    def __init__(self, xyxy: np.ndarray, cls: np.ndarray, conf: np.ndarray):
+        self.xyxy = xyxy
+        self.cls = cls
+        self.conf = conf
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self
+
+
+class _Result:
+    """Per-image result holding `boxes`."""
+
+    def __init__(self, boxes: _Boxes):
+        self.boxes = boxes
+
+
+class OnnxDetectionModel:
+    """
+    YOLOv8 ONNX graph run through ONNX Runtime with letterbox preprocessing and NMS.
+
+    @pre: The graph takes an (N, 3, imgsz, imgsz) float32 input and returns (N, 4 + classes, anchors).
+    """
+
+    def __init__(
+        self,
+        onnx_path: str,
+        imgsz: int = 640,
+        conf: float = 0.25,
+        iou: float = 0.7,
+        providers: Sequence[str] = ONNX_PROVIDERS,
+    ):
+        """
+        Creates the inference session.
+
+        @param onnx_path: Path to the .onnx / .int8.onnx graph
+        @param imgsz: Square model input size
+        @param conf: Minimum class score to keep a detection
+        @param iou: NMS IoU threshold
+        @param providers: Execution providers in order of preference
+        """
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        available = ort.get_available_providers()
+        self.session = ort.InferenceSession(
+            onnx_path, sess_options=so, providers=[p for p in providers if p in available]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.imgsz = imgsz
+        self.conf = conf
+        self.iou = iou
+
+    def __call__(self, source, classes: Optional[List[int]] = None, **kwargs) -> List[_Result]:
+        """
+        Detects objects in one image or a list of images.
+
+        @param source: BGR image or list of BGR images
+        @param classes: Class ids to keep, or None for all
+        @return: One result per image
+        """
+        images = [source] if isinstance(source, np.ndarray) and source.ndim == 3 else list(source)
+        batch, transforms = prepare_batch(images, self.imgsz)
+        (pred,) = self.session.run(None, {self.input_name: batch})
+        return [self._postprocess(p, transform, classes) for p, transform in zip(pred, transforms)]
+
+    def _postprocess(
+        self, pred: np.ndarray, transform: Tuple[float, Tuple[int, int]], classes: Optional[List[int]]
+    ) -> _Result:
+        """
+        Filters, NMS-suppresses and un-letterboxes the raw predictions of one image.
+
+        @param pred: Raw output shaped (4 + classes, anchors), boxes as cx, cy, w, h
+        @param transform: (ratio, pad) from letterbox
+        @param classes: Class ids to keep, or None for all
+        @return: Result with boxes in original image coordinates, highest score first
+        """
+        pred = pred.T
+        scores = pred[:, 4:]
+        cls = scores.argmax(axis=1)
+        conf = scores[np.arange(len(cls)), cls]
+
+        keep = conf >= self.conf
+        if classes is not None:
+            keep &= np.isin(cls, classes)
+        boxes, cls, conf = pred[keep, :4], cls[keep], conf[keep]
+
+        xywh = boxes.copy()
+        xywh[:, :2] -= xywh[:, 2:] / 2  # cx, cy -> top-left x, y
+        indices = np.asarray(cv2.dnn.NMSBoxes(xywh.tolist(), conf.tolist(), self.conf, self.iou), dtype=np.int64).reshape(-1)
+        indices = indices[np.argsort(-conf[indices])]
+
+        xyxy = np.concatenate([xywh[indices, :2], xywh[indices, :2] + xywh[indices, 2:]], axis=1)
+        ratio, pad = transform
+        xyxy = unletterbox_boxes(xyxy.astype(np.float32), ratio, pad)
+        return _Result(_Boxes(xyxy, cls[indices].astype(np.float32), conf[indices].astype(np.float32)))
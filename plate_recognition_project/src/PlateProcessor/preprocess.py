@@ -0,0 +1,131 @@
+"""
+YOLO Input Preprocessing
+------------------------
+
+Fused replacement for ultralytics' Python-side preprocessing. The letterboxed
+uint8 HWC BGR frame is read once and written once as a float32 CHW RGB array
+normalized to [0, 1], instead of separate BGR2RGB, float cast, /255 and
+transpose passes over memory.
+
+The kernel is JIT-compiled with Numba when it is installed and falls back to a
+single NumPy ufunc pass otherwise.
+
+This module uses JavaDoc-style docstrings with @param, @return, and @raises.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+import cv2
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+LETTERBOX_FILL = 114  # ultralytics' padding value
+_INV_255 = np.float32(1.0 / 255.0)
+
+
+def _bgr_hwc_to_rgb_chw_numpy(image: np.ndarray, out: np.ndarray) -> None:
+    """
+    NumPy fallback: one strided read, one write, no intermediate arrays.
+
+    @param image: uint8 HWC BGR image
+    @param out: float32 CHW output buffer
+    """
+    np.multiply(image[:, :, ::-1].transpose(2, 0, 1), _INV_255, out=out, dtype=np.float32)
+
+
+if njit is not None:  # pragma: no cover - exercised only where numba is installed
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _bgr_hwc_to_rgb_chw_numba(image, out):
+        h, w = image.shape[0], image.shape[1]
+        scale = np.float32(1.0 / 255.0)
+        for y in prange(h):
+            for x in range(w):
+                out[0, y, x] = image[y, x, 2] * scale
+                out[1, y, x] = image[y, x, 1] * scale
+                out[2, y, x] = image[y, x, 0] * scale
+
+    _bgr_hwc_to_rgb_chw = _bgr_hwc_to_rgb_chw_numba
+else:
+    _bgr_hwc_to_rgb_chw = _bgr_hwc_to_rgb_chw_numpy
+
+
+def bgr_hwc_to_rgb_chw(image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Converts a uint8 HWC BGR image into a normalized float32 CHW RGB array in one pass.
+
+    @param image: uint8 image shaped (H, W, 3) in BGR order
+    @param out: Optional preallocated float32 buffer shaped (3, H, W)
+    @return: float32 array shaped (3, H, W), RGB, values in [0, 1]
+    @raises ValueError: If image is not a 3-channel HWC array
+    """
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError(f"Expected HWC image with 3 channels, got shape {image.shape}")
+
+    h, w = image.shape[:2]
+    if out is None:
+        out = np.empty((3, h, w), dtype=np.float32)
+    _bgr_hwc_to_rgb_chw(image, out)
+    return out
+
+
+def letterbox(image: np.ndarray, imgsz: int = 640) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+    """
+    Resizes an image to fit a square canvas while keeping its aspect ratio.
+
+    @param image: BGR image
+    @param imgsz: Side length of the square canvas
+    @return: (padded image, scale ratio, (pad_x, pad_y))
+    """
+    h, w = image.shape[:2]
+    ratio = min(imgsz / h, imgsz / w)
+    new_w, new_h = int(round(w * ratio)), int(round(h * ratio))
+    if (new_w, new_h) != (w, h):
+        image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    pad_x, pad_y = (imgsz - new_w) // 2, (imgsz - new_h) // 2
+    padded = cv2.copyMakeBorder(
+        image,
+        pad_y, imgsz - new_h - pad_y,
+        pad_x, imgsz - new_w - pad_x,
+        cv2.BORDER_CONSTANT,
+        value=(LETTERBOX_FILL, LETTERBOX_FILL, LETTERBOX_FILL),
+    )
+    return padded, ratio, (pad_x, pad_y)
+
+
+def prepare_batch(images: List[np.ndarray], imgsz: int = 640) -> Tuple[np.ndarray, List[Tuple[float, Tuple[int, int]]]]:
+    """
+    Letterboxes and converts frames into one contiguous NCHW float32 batch.
+
+    @param images: List of BGR images (shapes may differ)
+    @param imgsz: Model input size
+    @return: (batch shaped (N, 3, imgsz, imgsz), per-image (ratio, pad) transforms)
+    """
+    batch = np.empty((len(images), 3, imgsz, imgsz), dtype=np.float32)
+    transforms = []
+    for i, image in enumerate(images):
+        padded, ratio, pad = letterbox(image, imgsz)
+        bgr_hwc_to_rgb_chw(padded, out=batch[i])
+        transforms.append((ratio, pad))
+    return batch, transforms
+
+
+def unletterbox_boxes(xyxy: np.ndarray, ratio: float, pad: Tuple[int, int]) -> np.ndarray:
+    """
+    Maps boxes from letterboxed model coordinates back to the original image.
+
+    @param xyxy: Boxes shaped (N, 4) in model input coordinates (NumPy array or torch tensor)
+    @param ratio: Scale ratio returned by letterbox
+    @param pad: (pad_x, pad_y) returned by letterbox
+    @return: Boxes shaped (N, 4) in original image coordinates, same type and device as xyxy
+    """
+    pad_x, pad_y = pad
+    # Column-wise in-place ops on a fresh result work for both ndarrays and (device) tensors.
+    out = xyxy / ratio
+    out[:, 0::2] -= pad_x / ratio
+    out[:, 1::2] -= pad_y / ratio
+    return out
@@ -7,17 +7,71 @@ and cropping regions of interest from images.
 
 Classes:
     Box: Simple container for bounding box and class ID.
+    BoxBatch: All detections of one image as contiguous arrays; indexing yields Box views.
     YOLODetector: Handles YOLO model inference and plate cropping utilities.
 
 This module uses JavaDoc-style docstrings with @param, @return, and @raises.
 """
 
 from ultralytics import YOLO
-from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Tuple, Optional, Union
+import functools
+import itertools
+import logging
+from dataclasses import dataclass, field
 import numpy as np
 import os
+import re
 import cv2
 
+from PlateProcessor.preprocess import prepare_batch, unletterbox_boxes
+
+# TensorRT engines are only valid on the GPU model they were built on; exports are tagged with it.
+GPU_ENGINE_SUFFIXES = (".int8.engine", ".engine")
+
+# Hardware-independent exports preferred over the raw .pt weights, fastest first.
+PORTABLE_EXPORT_SUFFIXES = ("_int8_openvino_model", ".onnx")
+
+# Every exported format; none of them carries the task metadata ultralytics needs.
+EXPORTED_SUFFIXES = GPU_ENGINE_SUFFIXES + PORTABLE_EXPORT_SUFFIXES
+
+# Inference backends: ultralytics (PyTorch or any export above) or a direct ONNX Runtime INT8 session.
+BACKENDS = ("ultralytics", "onnxruntime-int8")
+INT8_ONNX_SUFFIX = ".int8.onnx"
+
+# Where detect_plate leaves its boxes: host NumPy arrays, or device tensors for a GPU cropper.
+RETURN_DEVICES = ("cpu", "cuda")
+
+logger = logging.getLogger(__name__)
+
+
+def _torch():
+    """
+    Imports torch on use; it is provided by ultralytics, and this module must load without it.
+
+    @return: The torch module, or None if it is not installed
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch
+
+
+@functools.lru_cache(maxsize=None)
+def gpu_tag(device: int = 0) -> Optional[str]:
+    """
+    File-name tag for the local GPU, used to key TensorRT engines to the hardware they were built for.
+
+    @param device: CUDA device index
+    @return: Lower-case device name with non-alphanumerics as underscores (e.g. "nvidia_a10g"), or None without CUDA
+    """
+    torch = _torch()
+    if torch is None or not torch.cuda.is_available():
+        return None
+    return re.sub(r"[^0-9a-z]+", "_", torch.cuda.get_device_name(device).lower()).strip("_")
+
 
 class Box:
     """Container for a single YOLO bounding box detection.
@@ -36,117 +90,779 @@ class Box:
         @param conf: Float confidence of the detected plate
         @raises TypeError: If xyxy is not a tuple of four numbers or cls is not int
         @postcondition: Creates a Box object with xyxy reshaped to (1, 4) and cls stored as a list
+        @postcondition: Coordinates are float32; a contiguous float32 row is wrapped as a view, not copied
         """
-        self.xyxy = np.array(xyxy).reshape(1, 4)
+        self.xyxy = np.ascontiguousarray(xyxy, dtype=np.float32).reshape(1, 4)
         self.cls = [cls]
         self.conf = [conf]
 
 
+@dataclass(eq=False)
+class BoxBatch:
+    """Structure-of-arrays storage for all detections of one image.
+
+    Attributes:
+        xyxy (np.ndarray): Bounding boxes shaped (N, 4) formatted as [x1, y1, x2, y2].
+        cls (np.ndarray): Class IDs shaped (N,).
+        conf (np.ndarray): Confidences shaped (N,).
+
+    The arrays may be device tensors (detect_plate with return_device="cuda"); indexing then works on a
+    host copy made once per batch.
+    """
+
+    xyxy: np.ndarray
+    cls: np.ndarray
+    conf: np.ndarray
+    _host: Optional["BoxBatch"] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def empty(cls) -> "BoxBatch":
+        """
+        @return: BoxBatch without detections
+        """
+        return cls(np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return len(self.xyxy)
+
+    def __getitem__(self, i: int) -> Box:
+        """
+        @param i: Detection index
+        @return: Box whose xyxy is a view of row i (of the host copy for device tensors)
+        """
+        host = self.host()
+        return Box(host.xyxy[i], int(host.cls[i]), float(host.conf[i]))
+
+    def host(self) -> "BoxBatch":
+        """
+        @return: This batch if it holds NumPy arrays, else its host copy, made on the first call and reused
+        """
+        if isinstance(self.xyxy, np.ndarray):
+            return self
+        if self._host is None:
+            self._host = BoxBatch(self.xyxy.cpu().numpy(), self.cls.cpu().numpy(), self.conf.cpu().numpy())
+        return self._host
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
 class YOLODetector:
     """YOLOv8-based object detector specialized for license plates.
 
     Attributes:
         model (YOLO): Loaded YOLOv8 model instance.
         plate_class_id (int): ID of the class representing license plates.
+        fused_preprocess (bool): Whether frames are preprocessed by the fused kernel in preprocess.py.
+        imgsz (int): Model input size used by the fused preprocessing path.
     """
 
-    def __init__(self, model_path: str = "./src/models/yolov8n.pt", plate_class_id: int = 2):
+    def __init__(
+        self,
+        model_path: str = "./src/models/yolov8n.pt",
+        plate_class_id: int = 2,
+        fused_preprocess: bool = False,
+        imgsz: int = 640,
+        warmup: bool = False,
+        use_tensorrt: bool = False,
+        backend: str = "ultralytics",
+        compile_model: bool = False,
+    ):
         """
         Initializes the YOLO detector.
 
         @param model_path: Path to YOLOv8 weights file
         @param plate_class_id: Class ID used to filter license plate detections
+        @param fused_preprocess: Feed the model a ready NCHW tensor built in one pass, bypassing ultralytics' preprocessing
+        @param imgsz: Square model input size for the fused preprocessing path
+        @param warmup: Run one dummy forward pass so the first real call does not pay CuDNN autotuning
+        @param use_tensorrt: Run a TensorRT FP16 engine, building it from the sibling .pt weights on first use
+        @param backend: "ultralytics", or "onnxruntime-int8" to run <weights>.int8.onnx in an ONNX Runtime session
+        @param compile_model: Wrap PyTorch weights in torch.compile (torch >= 2.0); implies fused_preprocess
         @raises FileNotFoundError: If model_path does not exist
+        @raises ValueError: If backend is unknown
+        @raises RuntimeError: If use_tensorrt is set, no engine exists and no CUDA device is available to build one
         @postcondition: YOLO model is loaded and ready for inference
+        @postcondition: A TensorRT/OpenVINO/ONNX export next to a .pt file is loaded instead of it
+        @postcondition: PyTorch weights on CUDA run with TF32 matmuls and channels_last convolutions
+        @postcondition: With compile_model, PyTorch weights run through torch.compile when it is available
         """
-        self.model = YOLO(model_path)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown YOLO backend {backend!r}; expected one of {BACKENDS}")
+
+        if backend == "onnxruntime-int8":
+            from PlateProcessor.onnx_backend import OnnxDetectionModel  # needs onnxruntime
+
+            # Always the quantized graph: settings may point at the FP32 best.onnx written alongside it.
+            model_path = YOLODetector._weights_root(model_path) + INT8_ONNX_SUFFIX
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"INT8 ONNX model not found: {model_path}")
+            self.model = OnnxDetectionModel(model_path, imgsz=imgsz)
+            # The session letterboxes and normalizes internally.
+            fused_preprocess = False
+        else:
+            if use_tensorrt:
+                # Settings may point at an ONNX/OpenVINO export; engines are always built from the .pt weights.
+                model_path = YOLODetector._ensure_engine(YOLODetector._weights_root(model_path) + ".pt", imgsz)
+            model_path = YOLODetector.resolve_model_path(model_path)
+            if model_path.endswith(EXPORTED_SUFFIXES):
+                # Exported graphs carry no task metadata for ultralytics to infer.
+                self.model = YOLO(model_path, task="detect")
+            else:
+                self.model = YOLO(model_path)
+        self.channels_last = backend == "ultralytics" and model_path.endswith(".pt") and self._enable_tensor_cores()
+        self.compiled = compile_model and backend == "ultralytics" and model_path.endswith(".pt") and self._compile(imgsz)
+        if self.compiled:
+            # Every frame is letterboxed to one imgsz x imgsz tensor, so the graph is compiled only once.
+            fused_preprocess = True
+        self.model_path = model_path
         self.plate_class_id = plate_class_id
+        # Built once and passed to every model call instead of a fresh [plate_class_id] per frame.
+        self._classes = [int(plate_class_id)]
+        self.fused_preprocess = fused_preprocess
+        self.imgsz = imgsz
+        # Only TensorRT engines take FP16 input here; PyTorch weights and CPU exports stay in FP32.
+        self.half = backend == "ultralytics" and model_path.endswith(GPU_ENGINE_SUFFIXES)
+
+        if warmup:
+            self.warmup()
+
+    def warmup(self) -> None:
+        """
+        Runs one dummy inference at the production input size.
+
+        @postcondition: With fused_preprocess, cudnn.benchmark is enabled and has cached kernels for imgsz x imgsz input
+        @postcondition: Lazy CUDA/allocator initialization has already happened
+        """
+        # Autotuning caches the winning conv kernels per input shape. Only the fused path feeds one static
+        # imgsz x imgsz shape; ultralytics' own letterbox varies it per frame and would re-autotune each time.
+        torch = _torch()
+        if self.fused_preprocess and torch is not None:
+            torch.backends.cudnn.benchmark = True
 
-    def detect_plate(self, image: np.ndarray) -> List[Box]:
+        self._predict(np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8))
+
+    def _enable_tensor_cores(self) -> bool:
+        """
+        Lets PyTorch weights use tensor cores: TF32 matmuls/convs and channels_last memory layout.
+
+        @return: True if the model was converted to channels_last (CUDA available), else False
+        @postcondition: On CUDA the network is Conv+BN fused before its layout is converted
+        """
+        torch = _torch()
+        if torch is None or not torch.cuda.is_available():
+            return False
+
+        torch.set_float32_matmul_precision("high")
+        torch.backends.cudnn.allow_tf32 = True
+        # The predictor fuses Conv+BN on first use, allocating new contiguous weights; fuse first so the
+        # channels_last layout applied below is the one that actually runs (fusing again is a no-op).
+        self.model.fuse()
+        self.model.model = self.model.model.to(memory_format=torch.channels_last)
+        return True
+
+    def _compile(self, imgsz: int) -> bool:
+        """
+        Compiles the PyTorch network so elementwise ops after convolutions fuse into fewer kernels.
+
+        @param imgsz: Square input size the graph is compiled and test-run for
+        @return: True if the network was replaced by its compiled version, else False
+        @postcondition: On any compile or first-run failure the original eager network is kept
+        @postcondition: fuse() on the installed network returns the compiled network, so the predictor runs it
+        """
+        torch = _torch()
+        if torch is None or not hasattr(torch, "compile"):  # torch < 2.0
+            return False
+
+        # Compile the fused graph; see _enable_tensor_cores (a no-op if it already fused).
+        self.model.fuse()
+        eager = self.model.model
+        try:
+            compiled = torch.compile(eager, mode="reduce-overhead", fullgraph=False)
+            # Compilation is lazy; one dummy forward builds the kernels now, so Inductor/Triton errors surface here.
+            param = next(eager.parameters())
+            dummy = torch.zeros((1, 3, imgsz, imgsz), device=param.device, dtype=param.dtype)
+            if self.channels_last:
+                dummy = dummy.contiguous(memory_format=torch.channels_last)
+            with torch.no_grad():
+                compiled(dummy)
+        except Exception:
+            logger.warning("torch.compile failed; running the eager model", exc_info=True)
+            self.model.model = eager
+            return False
+        # The predictor keeps whatever model.fuse() returns; the wrapper would forward that call to the eager
+        # network, which returns itself and silently drops the compiled graph.
+        compiled.fuse = lambda *args, **kwargs: compiled
+        self.model.model = compiled
+        return True
+
+    def _predict(self, source):
+        """
+        Runs the model restricted to the plate class.
+
+        @param source: Image, list of images or NCHW tensor accepted by ultralytics
+        @return: ultralytics Results list
         """
-        Detects license plates in a given image.
+        if self.half:
+            return self.model(source, classes=self._classes, half=True)
+        return self.model(source, classes=self._classes)
 
-        @param image: BGR image as a NumPy ndarray
-        @return: List of Box objects representing detected plates
-        @raises ValueError: If image is None or not a valid ndarray
-        @postcondition: Returns empty list if no plates are detected
+    @staticmethod
+    def _ensure_engine(weights_path: str, imgsz: int) -> str:
+        """
+        Returns a TensorRT engine for the weights, exporting one next to them on first use.
+
+        @param weights_path: Path to .pt weights
+        @param imgsz: Input size the engine is built for
+        @return: Path to an existing or freshly built .engine file
+        @raises FileNotFoundError: If no engine exists and weights_path does not exist
+        @raises RuntimeError: If no engine exists and no CUDA device is available to build one
+        @postcondition: Concurrent callers (e.g. Gunicorn workers starting together) build the engine only once
         """
-        results = self.model(image, classes=[self.plate_class_id])
-        boxes: List[Box] = []
+        resolved = YOLODetector.resolve_model_path(weights_path)
+        if resolved.endswith(GPU_ENGINE_SUFFIXES):
+            return resolved
+
+        import fcntl  # POSIX only, like the Gunicorn deployment this guards
+        from PlateProcessor.model_export import export_engine  # imports this module
+
+        lock_path = YOLODetector._weights_root(weights_path) + ".engine.lock"
+        with open(lock_path, "w") as lock:
+            # The first worker builds; the others block here and then load the engine it wrote.
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            resolved = YOLODetector.resolve_model_path(weights_path)
+            if resolved.endswith(GPU_ENGINE_SUFFIXES):
+                return resolved
+            logger.warning("Building TensorRT engine for %s; this takes several minutes once", weights_path)
+            return export_engine(weights_path, imgsz=imgsz)
 
-        for r in results:
-            xyxy_array = r.boxes.xyxy.cpu().numpy()
-            cls_array = r.boxes.cls.cpu().numpy()
-            conf_array = r.boxes.conf.cpu().numpy()
-            for xyxy, cls_id, conf in zip(xyxy_array, cls_array, conf_array):
-                boxes.append(Box(xyxy, int(cls_id), float(conf)))
+    @staticmethod
+    def resolve_model_path(model_path: str) -> str:
+        """
+        Picks the fastest available artifact for the given weights.
 
-        return boxes
+        @param model_path: Path to YOLOv8 weights (.pt) or an exported model
+        @return: Path to an engine for the local GPU, a sibling OpenVINO or ONNX export if one exists, else model_path
+        @postcondition: An engine built for the local GPU (<root>.<gpu_tag>.engine) wins over any other artifact
+        @postcondition: An untagged best.engine is never picked, as it may have been built on another GPU
+        """
+        tag = gpu_tag()
+        if tag is not None:
+            base = YOLODetector._weights_root(model_path)
+            for suffix in GPU_ENGINE_SUFFIXES:
+                candidate = f"{base}.{tag}{suffix}"
+                if os.path.exists(candidate):
+                    return candidate
+
+        root, ext = os.path.splitext(model_path)
+        if ext != ".pt":
+            return model_path
+
+        for suffix in PORTABLE_EXPORT_SUFFIXES:
+            candidate = root + suffix
+            if os.path.exists(candidate):
+                return candidate
+        return model_path
 
     @staticmethod
-    def crop_plate(image: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+    def _weights_root(model_path: str) -> str:
+        """
+        Strips the weights or export suffix, giving the root shared by best.pt and all of its exports.
+
+        @param model_path: Path to .pt weights or any export (e.g. best.onnx, best.int8.onnx, best.<gpu>.int8.engine)
+        @return: Path without the suffix (and GPU tag), e.g. ".../best"
+        """
+        root = model_path.rstrip(os.sep)
+        for suffix in (INT8_ONNX_SUFFIX,) + EXPORTED_SUFFIXES + (".pt",):
+            if root.endswith(suffix):
+                root = root[: -len(suffix)]
+                if suffix in GPU_ENGINE_SUFFIXES:
+                    # best.<gpu>.engine: the GPU tag is part of the export name, not of the weights.
+                    root = os.path.splitext(root)[0]
+                break
+        return root
+
+    def detect_plate(self, image: np.ndarray, return_device: str = "cpu") -> Union[BoxBatch, List[BoxBatch]]:
+        """
+        Detects license plates in a given image, or in a stack of images with one model call.
+
+        @param image: BGR image shaped (H, W, 3), or a batch shaped (N, H, W, 3)
+        @param return_device: "cpu" for NumPy boxes, or "cuda" to keep boxes as device tensors (no D2H copy)
+        @return: BoxBatch for a single image (indexing yields Box); one BoxBatch per image for a batch
+        @raises ValueError: If image is None or not a valid ndarray, or return_device is unknown
+        @postcondition: Returns an empty BoxBatch if no plates are detected
+        """
+        if image.ndim == 4:
+            return self.detect_plates(list(image), return_device=return_device)
+        if return_device not in RETURN_DEVICES:
+            raise ValueError(f"return_device must be one of {RETURN_DEVICES}, got {return_device!r}")
+
+        source, transforms = self._model_input([image]) if self.fused_preprocess else (image, None)
+        results = self._predict(source)
+        if not results:
+            return BoxBatch.empty()
+        return self._boxes_from_result(results[0], transforms[0] if transforms else None, return_device)
+
+    def detect_plates(self, images: List[np.ndarray], return_device: str = "cpu") -> List[BoxBatch]:
+        """
+        Detects license plates in several images with a single batched model call.
+
+        @param images: List of BGR images as NumPy ndarrays (shapes may differ)
+        @param return_device: "cpu" for NumPy boxes, or "cuda" to keep boxes as device tensors (no D2H copy)
+        @return: One BoxBatch per input image, in input order
+        @raises ValueError: If return_device is unknown
+        @postcondition: The BoxBatch is empty for images without detections
+        """
+        if return_device not in RETURN_DEVICES:
+            raise ValueError(f"return_device must be one of {RETURN_DEVICES}, got {return_device!r}")
+        if not images:
+            return []
+
+        if self.fused_preprocess:
+            source, transforms = self._model_input(images)
+        else:
+            # ultralytics letterboxes every frame to a common shape and stacks them into one batch.
+            source, transforms = list(images), None
+        results = self._predict(source)
+        return [
+            self._boxes_from_result(r, transforms[i] if transforms else None, return_device)
+            for i, r in enumerate(results)
+        ]
+
+    def detect_plate_stream(
+        self,
+        frames: Iterable[np.ndarray],
+        batch_size: int = 1,
+        return_device: str = "cpu",
+    ) -> Iterator[Tuple[np.ndarray, BoxBatch]]:
+        """
+        Detects plates in a stream of frames, preparing the next batch while the current one runs.
+
+        A prefetch thread pulls the next batch_size frames from the iterator (decoding them, for a
+        video reader) and, with fused_preprocess, letterboxes them; for PyTorch weights on CUDA it also
+        uploads the batch from pinned memory on a side stream. Inference releases the GIL, so decoding
+        and preprocessing of batch N+1 overlap inference of batch N.
+
+        @param frames: Iterable of BGR images, e.g. a generator over cv2.VideoCapture reads
+        @param batch_size: Frames per model call
+        @param return_device: "cpu" for NumPy boxes, or "cuda" to keep boxes as device tensors (no D2H copy)
+        @return: Iterator of (frame, BoxBatch) pairs, in input order
+        @raises ValueError: If return_device is unknown
+        @postcondition: At most one batch is prepared ahead of the one being inferred
+        """
+        if return_device not in RETURN_DEVICES:
+            raise ValueError(f"return_device must be one of {RETURN_DEVICES}, got {return_device!r}")
+
+        frames = iter(frames)
+        stream = self._upload_stream()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="plate-prefetch") as prefetch:
+            pending = prefetch.submit(self._stage_batch, frames, batch_size, stream)
+            while True:
+                batch, source, transforms = pending.result()
+                if not batch:
+                    return
+                if stream is not None:
+                    torch = _torch()
+                    # Inference must not read the batch before its upload on the side stream finishes, and the
+                    # caching allocator must not hand its memory out again while the compute stream still reads it.
+                    compute = torch.cuda.current_stream()
+                    compute.wait_stream(stream)
+                    source.record_stream(compute)
+                pending = prefetch.submit(self._stage_batch, frames, batch_size, stream)
+
+                results = self._predict(source)
+                for i, (frame, result) in enumerate(zip(batch, results)):
+                    yield frame, self._boxes_from_result(result, transforms[i] if transforms else None, return_device)
+
+    def _upload_stream(self):
+        """
+        Creates the side CUDA stream detect_plate_stream uploads batches on.
+
+        @return: torch.cuda.Stream for fused-preprocess PyTorch weights on CUDA, else None
+        """
+        # channels_last is only enabled for PyTorch weights on an available CUDA device.
+        if not (self.fused_preprocess and self.channels_last):
+            return None
+        return _torch().cuda.Stream()
+
+    def _stage_batch(self, frames: Iterator[np.ndarray], batch_size: int, stream=None):
+        """
+        Pulls and prepares the next batch of a frame stream; runs on the prefetch thread.
+
+        @param frames: Frame iterator shared with detect_plate_stream
+        @param batch_size: Maximum frames to pull
+        @param stream: Side CUDA stream to upload the batch on, or None to leave it on the host
+        @return: (frames, model source, letterbox transforms or None); frames is empty at the end of the stream
+        """
+        batch = list(itertools.islice(frames, batch_size))
+        if not batch or not self.fused_preprocess:
+            return batch, batch, None
+
+        source, transforms = self._model_input(batch)
+        if stream is not None:
+            with _torch().cuda.stream(stream):
+                source = source.pin_memory().to("cuda", non_blocking=True)
+        return batch, source, transforms
+
+    @staticmethod
+    def _boxes_from_result(result, transform=None, return_device: str = "cpu") -> BoxBatch:
+        """
+        Converts one ultralytics result into a BoxBatch with a single device-to-host copy.
+
+        @param result: ultralytics Results object for one image
+        @param transform: Optional (ratio, pad) letterbox transform to undo
+        @param return_device: "cpu", or "cuda" to keep the boxes where the model produced them
+        @return: BoxBatch holding the result's detections
+        @postcondition: xyxy/cls/conf are views of one host copy of the [N, 6] boxes tensor ("cpu")
+        @postcondition: xyxy is float32 on the host ("cpu")
+        @postcondition: Backends that already produce host arrays return them unchanged ("cuda")
+        """
+        if return_device == "cpu":
+            # Boxes.cpu() copies the whole data tensor once; xyxy/cls/conf are column views of it.
+            r_boxes = result.boxes.cpu().numpy()
+            # Pixel coordinates are kept as float32; a no-op for ultralytics output, which already is.
+            xyxy_array = r_boxes.xyxy.astype(np.float32, copy=False)
+            cls_array, conf_array = r_boxes.cls, r_boxes.conf
+        else:
+            r_boxes = result.boxes
+            xyxy_array, cls_array, conf_array = r_boxes.xyxy, r_boxes.cls, r_boxes.conf
+        if transform is not None:
+            xyxy_array = unletterbox_boxes(xyxy_array, *transform)
+
+        return BoxBatch(xyxy_array, cls_array, conf_array)
+
+    def _model_input(self, images: List[np.ndarray]):
+        """
+        Builds a ready-to-run NCHW float tensor with the fused preprocessing kernel.
+
+        @param images: List of BGR images
+        @return: (torch tensor shaped (N, 3, imgsz, imgsz), per-image letterbox transforms)
+        @postcondition: ultralytics skips its own letterbox/normalize/transpose for tensor input
+        """
+        torch = _torch()
+        batch, transforms = prepare_batch(images, self.imgsz)
+        tensor = torch.from_numpy(batch)
+        if self.channels_last:
+            # Matches the model's layout so convs skip a per-call NCHW -> NHWC transpose on the device.
+            tensor = tensor.contiguous(memory_format=torch.channels_last)
+        return tensor, transforms
+
+    @staticmethod
+    def crop_plate(image: np.ndarray, box: Tuple[int, int, int, int], tiled: bool = False) -> np.ndarray:
         """
         Crops a subregion from an image given a bounding box.
 
-        @param image: Original BGR image
+        @param image: Original BGR image, or the output of tile_image when tiled is True
         @param box: Tuple of coordinates (x1, y1, x2, y2)
+        @param tiled: Whether image is in the tiled layout produced by tile_image
         @return: Cropped image region
         @raises ValueError: If box coordinates are out of bounds
         """
+        if tiled:
+            return YOLODetector.crop_plate_tiled(image, box)
         x1, y1, x2, y2 = map(int, box)
         return image[y1:y2, x1:x2]
 
+    @staticmethod
+    def tile_image(image: np.ndarray, tile: int = 32) -> np.ndarray:
+        """
+        Re-lays an HWC image out as contiguous tile x tile blocks.
+
+        Each block is contiguous in memory, so a crop touches only the blocks intersecting the box
+        instead of full image rows. The re-layout itself is one pass over the frame; it pays off when
+        several plates are cropped from the same large frame, or when frames arrive tiled.
+
+        @param image: HWC image
+        @param tile: Block side in pixels
+        @return: Array shaped (ceil(H/tile), ceil(W/tile), tile, tile, C); edges are zero-padded
+        """
+        h, w, c = image.shape
+        pad_h, pad_w = -h % tile, -w % tile
+        if pad_h or pad_w:
+            image = np.pad(image, ((0, pad_h), (0, pad_w), (0, 0)))
+        rows, cols = image.shape[0] // tile, image.shape[1] // tile
+        return np.ascontiguousarray(image.reshape(rows, tile, cols, tile, c).transpose(0, 2, 1, 3, 4))
+
+    @staticmethod
+    def crop_plate_tiled(tiled: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Crops a box from an image in tile_image layout, gathering only the intersecting tiles.
+
+        @param tiled: Output of tile_image
+        @param box: Tuple of coordinates (x1, y1, x2, y2) in original image pixels
+        @return: Contiguous HWC crop, identical to crop_plate on the original image
+        """
+        tile = tiled.shape[2]
+        x1, y1, x2, y2 = map(int, box)
+        ty0, ty1 = y1 // tile, -(-y2 // tile)
+        tx0, tx1 = x1 // tile, -(-x2 // tile)
+
+        blocks = tiled[ty0:ty1, tx0:tx1]
+        rows, cols = blocks.shape[:2]
+        region = blocks.transpose(0, 2, 1, 3, 4).reshape(rows * tile, cols * tile, tiled.shape[4])
+        oy, ox = y1 - ty0 * tile, x1 - tx0 * tile
+        return region[oy:oy + (y2 - y1), ox:ox + (x2 - x1)]
+
+    @staticmethod
+    def expand_and_crop(
+        image: np.ndarray,
+        box: Tuple[float, float, float, float],
+        expand_ratio: float,
+        output_size: Tuple[int, int],
+        use_umat: bool = False,
+    ) -> np.ndarray:
+        """
+        Expands a bounding box, crops it from the image and resizes the crop.
+
+        @param image: Original BGR image
+        @param box: Tuple of coordinates (x1, y1, x2, y2)
+        @param expand_ratio: Fraction to expand the bounding box on each side
+        @param output_size: Output dimensions (width, height)
+        @param use_umat: Resize through cv2.UMat so OpenCV can run it on an OpenCL device (see crop_and_resize)
+        @return: Cropped plate resized to output_size
+        @postcondition: Expanded box is clipped to the image bounds and never empty
+        """
+        h, w = image.shape[:2]
+        return YOLODetector.crop_and_resize(
+            image, YOLODetector._expand_box(box, w, h, expand_ratio), output_size, use_umat=use_umat
+        )
+
+    @staticmethod
+    def crop_and_resize(
+        image: np.ndarray,
+        box: Tuple[int, int, int, int],
+        output_size: Tuple[int, int],
+        use_umat: bool = False,
+    ) -> np.ndarray:
+        """
+        Crops an already expanded, clipped integer box from the image and resizes the crop.
+
+        @param image: Original BGR image
+        @param box: Integer (x1, y1, x2, y2) inside the image, e.g. a row of expand_boxes
+        @param output_size: Output dimensions (width, height)
+        @param use_umat: Upload the frame as a cv2.UMat and resize the ROI there (OpenCV T-API);
+                         ignored when OpenCV has no usable OpenCL device
+        @return: Cropped plate resized to output_size
+        @postcondition: A crop already matching output_size is returned without resampling
+        @postcondition: Source pixels are read once; no intermediate crop copy is made before resampling
+        """
+        x1, y1, x2, y2 = box
+        out_w, out_h = output_size
+        crop_w, crop_h = x2 - x1, y2 - y1
+
+        if crop_w == out_w and crop_h == out_h:
+            return np.ascontiguousarray(image[y1:y2, x1:x2])
+
+        # INTER_AREA is both faster and alias-free when shrinking.
+        interpolation = cv2.INTER_AREA if crop_h > out_h else cv2.INTER_LINEAR
+
+        if use_umat and cv2.ocl.haveOpenCL():
+            # The ROI is a view of the uploaded frame; only the resized plate is downloaded.
+            roi = cv2.UMat(cv2.UMat(image), (int(y1), int(y2)), (int(x1), int(x2)))
+            return cv2.resize(roi, output_size, interpolation=interpolation).get()
+
+        # cv2 reads the strided ROI view directly, so this is a single pass over the box.
+        return cv2.resize(image[y1:y2, x1:x2], output_size, interpolation=interpolation)
+
+    @staticmethod
+    def _expand_box(box: Tuple[float, float, float, float], w: int, h: int, expand_ratio: float) -> Tuple[int, int, int, int]:
+        """
+        Expands a bounding box by expand_ratio on each side and clips it to the image.
+
+        @param box: Tuple of coordinates (x1, y1, x2, y2)
+        @param w: Image width
+        @param h: Image height
+        @param expand_ratio: Fraction to expand the bounding box on each side
+        @return: Integer (x1, y1, x2, y2) inside the image, at least one pixel wide and high
+        """
+        return tuple(YOLODetector.expand_boxes(box, (w, h), expand_ratio)[0].tolist())
+
+    @staticmethod
+    def expand_boxes(xyxy: np.ndarray, image_sizes, expand_ratio: float) -> np.ndarray:
+        """
+        Expands every box by expand_ratio on each side and clips it to its image, as array math over all boxes.
+
+        @param xyxy: Boxes shaped (N, 4) formatted as [x1, y1, x2, y2], e.g. BoxBatch.xyxy
+        @param image_sizes: (width, height) shared by all boxes, or one (width, height) per box
+        @param expand_ratio: Fraction to expand each bounding box on each side
+        @return: int32 array shaped (N, 4); every box inside its image, at least one pixel wide and high
+        """
+        xyxy = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4)
+        wh = np.asarray(image_sizes, dtype=np.float32).reshape(-1, 2)
+        pad = (xyxy[:, 2:] - xyxy[:, :2]) * expand_ratio
+
+        # Top-left stays inside the image, bottom-right at least one pixel past it.
+        top_left = np.clip(xyxy[:, :2] - pad, 0, wh - 1).astype(np.int32)
+        bottom_right = np.clip(xyxy[:, 2:] + pad, top_left + 1, wh).astype(np.int32)
+        return np.concatenate([top_left, bottom_right], axis=1)
+
+    @staticmethod
+    def expand_and_crop_batch_gpu(
+        images: List[np.ndarray],
+        boxes: List[Tuple[float, float, float, float]],
+        expand_ratio: float,
+        output_size: Tuple[int, int],
+        device: str = "cuda",
+    ) -> List[np.ndarray]:
+        """
+        GPU variant of expand_and_crop for several images: crops and resizes on the device with roi_align.
+
+        Each frame is uploaded once (from pinned memory on CUDA) and only the small resized crops
+        come back, in a single device-to-host copy for the whole batch.
+
+        @param images: BGR images, one per box
+        @param boxes: One (x1, y1, x2, y2) box per image
+        @param expand_ratio: Fraction to expand each bounding box on each side
+        @param output_size: Output dimensions (width, height)
+        @param device: Torch device to run on
+        @return: uint8 BGR crops shaped (height, width, 3), in input order
+        @raises ImportError: If torch or torchvision is not installed
+        """
+        from torchvision.ops import roi_align  # raises ImportError without torch as well
+
+        torch = _torch()
+
+        if not images:
+            return []
+
+        out_w, out_h = output_size
+        pin = torch.device(device).type == "cuda"
+        expanded = YOLODetector.expand_boxes(boxes, [image.shape[1::-1] for image in images], expand_ratio)
+        crops = []
+        for image, (x1, y1, x2, y2) in zip(images, expanded.tolist()):
+            frame = torch.from_numpy(np.ascontiguousarray(image))
+            if pin:
+                frame = frame.pin_memory()
+            frame = frame.to(device, non_blocking=True).permute(2, 0, 1).unsqueeze(0).float()
+            roi = torch.tensor([[0, x1, y1, x2, y2]], dtype=torch.float32, device=device)
+            # sampling_ratio=-1 averages over each output bin, which matches INTER_AREA when shrinking.
+            crops.append(roi_align(frame, roi, output_size=(out_h, out_w), sampling_ratio=-1, aligned=True))
+
+        batch = torch.cat(crops).round_().clamp_(0, 255).to(torch.uint8).permute(0, 2, 3, 1).contiguous()
+        return list(batch.cpu().numpy())
+
+    def detect_and_crop(
+        self,
+        image: np.ndarray,
+        expand_ratio: float = 0.1,
+        output_size: Tuple[int, int] = (256, 128),
+        use_umat: bool = False,
+    ) -> Optional[Tuple[np.ndarray, List[float]]]:
+        """
+        Detects the first plate with the already loaded model, then crops and resizes it.
+
+        @param image: BGR input image
+        @param expand_ratio: Fraction to expand the bounding box (default 0.1)
+        @param output_size: Output dimensions (width, height)
+        @param use_umat: Crop and resize through cv2.UMat / OpenCL when available
+        @return: Cropped and resized plate image and its confidence, or None if no plate is found
+        """
+        boxes = self.detect_plate(image)
+
+        if not boxes:
+            logger.warning("YOLO: no plate detected.")
+            return None
+
+        conf = boxes[0].conf
+        cropped_resized = YOLODetector.expand_and_crop(
+            image, boxes[0].xyxy[0], expand_ratio, output_size, use_umat=use_umat
+        )
+        logger.info("YOLO: plate cropped and resized to %s", output_size)
+        return (cropped_resized, conf)
+
     @staticmethod
     def detect_plate_yolo(
         image: cv2.Mat,
         model_path: str,
         expand_ratio: float = 0.1,
         output_size: Tuple[int, int] = (256, 128),
+        use_umat: bool = False,
     ) -> Optional[cv2.Mat]:
         """
         Detects and crops a license plate with optional expansion and resizing.
 
+        The detector is loaded on the first call for a model path and reused afterwards
+        (see _get_detector).
+
         @param image: BGR input image
         @param model_path: Path to YOLO model weights
         @param expand_ratio: Fraction to expand the bounding box (default 0.1)
         @param output_size: Output dimensions (width, height)
+        @param use_umat: Crop and resize through cv2.UMat so OpenCV can offload the resize to OpenCL
         @return: Cropped and resized plate image and its confidence, or None if detection fails
         @raises FileNotFoundError: If model_path does not exist
         @raises Exception: If YOLO detector cannot be initialized
         """
         try:
-            from PlateProcessor.yolo_detector import YOLODetector  # type: ignore
-
-            if not os.path.exists(model_path):
-                print(f"WARNING: YOLO model not found at {model_path}")
-                return None
-
-            detector = YOLODetector(model_path=model_path, plate_class_id=0)
-            boxes = detector.detect_plate(image)
+            detector = _get_detector(model_path, 0)
+            return detector.detect_and_crop(
+                image, expand_ratio=expand_ratio, output_size=output_size, use_umat=use_umat
+            )
 
-            if not boxes:
-                print("WARNING: YOLO: no plate detected.")
-                return None
+        except FileNotFoundError:
+            logger.warning("YOLO model not found at %s", model_path)
+            return None
+        except Exception as e:
+            logger.debug("YOLO detector not available: %s", e)
+            return None
 
-            x1, y1, x2, y2 = boxes[0].xyxy[0]
-            h, w = image.shape[:2]
-            conf = boxes[0].conf
+    @classmethod
+    def detect_plates_yolo(
+        cls,
+        images: Union[np.ndarray, List[np.ndarray]],
+        model_path: str,
+        expand_ratio: float = 0.1,
+        output_size: Tuple[int, int] = (256, 128),
+    ) -> List[Optional[Tuple[np.ndarray, List[float]]]]:
+        """
+        Batched detect_plate_yolo: one forward pass for all frames, then crop and resize each plate.
 
-            dx = (x2 - x1) * expand_ratio
-            dy = (y2 - y1) * expand_ratio
-            x1_new = max(0, int(x1 - dx))
-            y1_new = max(0, int(y1 - dy))
-            x2_new = min(w, int(x2 + dx))
-            y2_new = min(h, int(y2 + dy))
+        @param images: Batch shaped (N, H, W, 3) or a list of BGR images
+        @param model_path: Path to YOLO model weights
+        @param expand_ratio: Fraction to expand each bounding box (default 0.1)
+        @param output_size: Output dimensions (width, height)
+        @return: One (cropped plate, confidence) per image, or None where no plate is found;
+                 every entry is None if the model cannot be loaded
+        """
+        images = list(images)
+        try:
+            detector = _get_detector(model_path, 0)
+            detections = detector.detect_plates(images)
+        except FileNotFoundError:
+            logger.warning("YOLO model not found at %s", model_path)
+            return [None] * len(images)
+        except Exception as e:
+            logger.debug("YOLO detector not available: %s", e)
+            return [None] * len(images)
+
+        results: List[Optional[Tuple[np.ndarray, List[float]]]] = [None] * len(images)
+        found = [i for i, boxes in enumerate(detections) if boxes]
+        # Expand all plate boxes in one array operation, each clipped to its own frame.
+        expanded = cls.expand_boxes(
+            [detections[i][0].xyxy[0] for i in found], [images[i].shape[1::-1] for i in found], expand_ratio
+        )
+        for i, box in zip(found, expanded):
+            results[i] = (cls.crop_and_resize(images[i], box, output_size), detections[i][0].conf)
+        return results
+
+
+@functools.lru_cache(maxsize=4)
+def _get_detector(model_path: str, plate_class_id: int) -> YOLODetector:
+    """
+    Returns a loaded detector for the model, constructing it only on the first call.
 
-            cropped = YOLODetector.crop_plate(image, (x1_new, y1_new, x2_new, y2_new))
-            cropped_resized = cv2.resize(cropped, output_size, interpolation=cv2.INTER_LINEAR)
-            print(f"INFO: YOLO: plate cropped and resized to {output_size}")
-            return (cropped_resized, conf)
+    The weights file is checked only here, so per-frame calls on a cached detector
+    do not stat the (possibly network-mounted) model path.
 
-        except Exception as e:
-            print(f"DEBUG: YOLO detector not available: {e}")
-            return None
+    @param model_path: Path to YOLO model weights
+    @param plate_class_id: Class ID used to filter license plate detections
+    @return: Cached YOLODetector
+    @raises FileNotFoundError: If model_path does not exist
+    @raises Exception: Whatever YOLODetector raised; failed loads are not cached
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"YOLO model not found: {model_path}")
+    return YOLODetector(model_path=model_path, plate_class_id=plate_class_id)
 
 
 def _main():  # pragma: no cover
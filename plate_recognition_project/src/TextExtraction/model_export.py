@@ -0,0 +1,106 @@
+"""
+OCR Model Export
+----------------
+
+One-time build step that stores the fast-plate-ocr ONNX model next to the
+YOLO weights (src/models/ocr/<model_name>/) and writes an ONNX Runtime
+pre-optimized copy of the graph, so workers load a local, already-fused
+model instead of resolving the hub cache and re-running graph optimizations
+on every start.
+
+    <model_name>/model.onnx            original graph from the hub
+    <model_name>/model.optimized.onnx  graph after ORT_ENABLE_EXTENDED optimizations (portable across hosts)
+    <model_name>/plate_config.yaml     fast-plate-ocr plate config
+    <model_name>/model.fp16.onnx       half-precision weights/activations (--fp16, GPU hosts)
+
+OCRReader picks these files up when constructed with model_dir; the FP16
+graph is only used when the CUDA execution provider is available.
+
+Usage:
+    python -m TextExtraction.model_export --model cct-xs-v1-global-model
+    python -m TextExtraction.model_export --model cct-xs-v1-global-model --fp16
+"""
+
+import argparse
+import os
+import pathlib
+import tempfile
+
+import onnxruntime as ort
+from fast_plate_ocr.inference import hub
+
+from TextExtraction.ocr_reader import OCR_CONFIG_FILE, OCR_FP16_FILE, OCR_ONNX_FILE, OCR_OPTIMIZED_FILE, OCR_PROVIDERS
+
+OCR_MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "ocr")
+
+
+def export_ocr_model(model_name: str = "cct-xs-v1-global-model", model_dir: str = OCR_MODEL_DIR, fp16: bool = False) -> str:
+    """
+    Downloads the OCR model into model_dir and saves an ORT-optimized copy.
+
+    @param model_name: Name of the fast-plate-ocr hub model
+    @param model_dir: Root folder for exported OCR models
+    @param fp16: Also write an FP16 copy of the graph (requires onnxconverter-common)
+    @return: Path of the written optimized ONNX file
+    @postcondition: <model_dir>/<model_name>/ holds model.onnx, model.optimized.onnx and plate_config.yaml
+    """
+    folder = os.path.join(model_dir, model_name)
+    os.makedirs(folder, exist_ok=True)
+    onnx_path = os.path.join(folder, OCR_ONNX_FILE)
+    config_path = os.path.join(folder, OCR_CONFIG_FILE)
+    optimized_path = os.path.join(folder, OCR_OPTIMIZED_FILE)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        downloaded_model, downloaded_config = hub.download_model(model_name, save_directory=pathlib.Path(tmp))
+        os.replace(downloaded_model, onnx_path)
+        os.replace(downloaded_config, config_path)
+
+    # Creating a session with optimized_model_filepath serializes the fused graph. ENABLE_ALL would also
+    # bake in provider/CPU-specific layout transforms, so the saved file stops at the portable EXTENDED level.
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    so.optimized_model_filepath = optimized_path
+    available = ort.get_available_providers()
+    ort.InferenceSession(onnx_path, sess_options=so, providers=[p for p in OCR_PROVIDERS if p in available])
+
+    if fp16:
+        export_fp16(onnx_path, os.path.join(folder, OCR_FP16_FILE))
+    return optimized_path
+
+
+def export_fp16(onnx_path: str, fp16_path: str) -> str:
+    """
+    Converts an FP32 ONNX graph to FP16 weights and activations.
+
+    @param onnx_path: Source FP32 ONNX file
+    @param fp16_path: Destination file
+    @return: fp16_path
+    @raises ImportError: If onnx or onnxconverter-common is not installed
+    @postcondition: Graph inputs/outputs keep their original types, so callers feed the same uint8 images
+    """
+    import onnx  # pip install onnx onnxconverter-common
+    from onnxconverter_common import float16
+
+    model = float16.convert_float_to_float16(onnx.load(onnx_path), keep_io_types=True)
+    onnx.save(model, fp16_path)
+    return fp16_path
+
+
+def _main():  # pragma: no cover
+    """
+    Command-line entry point.
+
+    @postcondition: Prints the path of the exported artifact
+    """
+    parser = argparse.ArgumentParser(description="Export fast-plate-ocr model for deployment.")
+    parser.add_argument("--model", default="cct-xs-v1-global-model", help="fast-plate-ocr hub model name")
+    parser.add_argument("--model-dir", default=OCR_MODEL_DIR, help="Root folder for exported OCR models")
+    parser.add_argument("--fp16", action="store_true", help="Also write an FP16 graph for CUDA hosts")
+    args = parser.parse_args()
+
+    path = export_ocr_model(args.model, args.model_dir, fp16=args.fp16)
+    print(f"INFO: Exported OCR model to {path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _main()
@@ -8,16 +8,34 @@ Pipeline:
   4. Show raw image for 2 seconds
 """
 
+import logging
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
+import numpy as np
 from fast_plate_ocr import LicensePlateRecognizer  # pip install fast-plate-ocr
 from PlateProcessor.yolo_detector import YOLODetector
 from utils.image_utils import show_image, load_image
 
+try:  # installed with fast-plate-ocr
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+logger = logging.getLogger(__name__)
+
+# Execution providers in order of preference; unavailable ones are skipped.
+OCR_PROVIDERS = ("CUDAExecutionProvider", "CPUExecutionProvider")
+
+# File names written by TextExtraction/model_export.py under <model_dir>/<model_name>/.
+OCR_FP16_FILE = "model.fp16.onnx"  # only used with the CUDA provider; FP16 is slower than FP32 on CPU
+OCR_OPTIMIZED_FILE = "model.optimized.onnx"
+OCR_ONNX_FILE = "model.onnx"
+OCR_CONFIG_FILE = "plate_config.yaml"
+
 
 class OCRReader:
     """
@@ -29,15 +47,64 @@ class OCRReader:
     @post: Confidence is 100.0 if text is detected, else 0.0.
     """
 
-    def __init__(self, model_name: str = "cct-xs-v1-global-model") -> None:
+    def __init__(self, model_name: str = "cct-xs-v1-global-model", model_dir: Optional[str] = None) -> None:
         """
         Initializes the OCR reader with a pretrained fast-plate-ocr model.
 
         @param model_name: Name of the fast-plate-ocr model.
+        @param model_dir: Folder holding models exported by TextExtraction/model_export.py, if any.
         @post: OCR model is loaded and ready for inference.
+        @post: A locally exported (pre-optimized) ONNX graph is used instead of the hub copy when present.
+        @post: On CUDA hosts a locally exported FP16 graph is preferred over the FP32 ones.
+        """
+        logger.info("Initializing OCR model: %s", model_name)
+        self.ocr = LicensePlateRecognizer(model_name, **OCRReader._session_kwargs(model_name, model_dir))
+
+    def warmup(self, batch_size: int = 1, size: Tuple[int, int] = (256, 128)) -> None:
+        """
+        Runs one dummy OCR batch so session initialization happens before the first request.
+
+        @param batch_size: Number of dummy images (use the production batch size).
+        @param size: Dummy image size (width, height).
+        @post: ONNX Runtime has allocated buffers and selected kernels for this batch size.
+        """
+        width, height = size
+        self.ocr.run([np.zeros((height, width, 3), dtype=np.uint8)] * batch_size)
+
+    @staticmethod
+    def _session_kwargs(model_name: str, model_dir: Optional[str]) -> dict:
+        """
+        Builds ONNX Runtime arguments for LicensePlateRecognizer.
+
+        @param model_name: Name of the fast-plate-ocr model.
+        @param model_dir: Folder holding exported models, or None.
+        @return: Keyword arguments (empty when neither onnxruntime nor a local export is available).
         """
-        print(f"INFO: Initializing OCR model: {model_name}")
-        self.ocr = LicensePlateRecognizer(model_name)
+        kwargs = {}
+        available = ort.get_available_providers() if ort is not None else []
+
+        if model_dir:
+            folder = os.path.join(model_dir, model_name)
+            config_path = os.path.join(folder, OCR_CONFIG_FILE)
+            candidates = (OCR_OPTIMIZED_FILE, OCR_ONNX_FILE)
+            if "CUDAExecutionProvider" in available:
+                candidates = (OCR_FP16_FILE,) + candidates
+            for file_name in candidates:
+                onnx_path = os.path.join(folder, file_name)
+                if os.path.exists(onnx_path) and os.path.exists(config_path):
+                    kwargs["onnx_model_path"] = onnx_path
+                    kwargs["plate_config_path"] = config_path
+                    break
+
+        if ort is not None:
+            so = ort.SessionOptions()
+            # A pre-optimized graph already has its portable fusions applied; ENABLE_ALL still runs the
+            # layout transforms specific to this host's provider, which the export deliberately leaves out.
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            kwargs["sess_options"] = so
+            kwargs["providers"] = [p for p in OCR_PROVIDERS if p in available]
+
+        return kwargs
 
     def extract_text(self, img: cv2.Mat) -> Optional[Tuple[str, float]]:
         """
@@ -56,12 +123,41 @@ class OCRReader:
         try:
             text = self.ocr.run(img)
         except Exception as e:
-            print(f"ERROR: fast-plate-ocr failed: {e}")
+            logger.error("fast-plate-ocr failed: %s", e)
             return None
 
         confidence = 100.0 if text else 0.0
         return (text, confidence) if text else None
 
+    def extract_text_batch(self, imgs: List[cv2.Mat]) -> List[Optional[Tuple[str, float]]]:
+        """
+        Run OCR on several images with a single recognizer call.
+
+        @param imgs: List of cv2 images in BGR format.
+        @return: One entry per input image, in order: (detected_text, confidence) or None.
+        @post: Invalid (None/empty) images yield None without being sent to the recognizer.
+        @post: Every entry is None if the batched OCR call fails.
+        """
+        results: List[Optional[Tuple[str, float]]] = [None] * len(imgs)
+        valid = [i for i, img in enumerate(imgs) if img is not None and img.size > 0]
+        if not valid:
+            return results
+
+        try:
+            # fast-plate-ocr resizes each image to the model input and runs them as one batch.
+            texts = self.ocr.run([imgs[i] for i in valid])
+        except Exception as e:
+            logger.error("fast-plate-ocr batch failed: %s", e)
+            return results
+
+        if len(texts) != len(valid):
+            logger.error("fast-plate-ocr returned %d results for %d images", len(texts), len(valid))
+            return results
+
+        for i, text in zip(valid, texts):
+            results[i] = (text, 100.0) if text else None
+        return results
+
 
 def main() -> None:  # pragma: no cover
     """
@@ -1,8 +1,32 @@
-import numpy as np
+import logging
+import os
+
+# Thread pools: OpenCV, OpenMP/MKL (NumPy, onnxruntime) and torch each size a pool to every core,
+# and under concurrent requests they oversubscribe the CPU. Must be set before those libraries load.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 import cv2
+cv2.setNumThreads(1)  # one thread per OpenCV call; request threads provide the parallelism
+
+try:
+    import torch
+    torch.set_num_threads(os.cpu_count() or 1)  # single inference thread gets the intra-op pool
+    torch.set_num_interop_threads(1)
+except ImportError:
+    pass
+
+import numpy as np
 from flask import Flask, request, jsonify
+from core.batching import BatchCoalescer
+from core.inference_server import InferenceServer
 from core.workflow import PlateRecognizer
-from config.settings import YOLO_MODEL_PATH, OCR_MODEL_NAME
+from utils.image_utils import decode_image
+from utils.plate_text import normalize_plate_text
+from config.settings import YOLO_MODEL_PATH, OCR_MODEL_NAME, YOLO_OUTPUT_SIZE, MAX_BATCH_SIZE, BATCH_WINDOW_MS, INFERENCE_PROCESS
+
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
 
 
 class PlateAPI:
@@ -11,15 +35,52 @@ class PlateAPI:
 
     @pre: `YOLO_MODEL_PATH` and `OCR_MODEL_NAME` must be defined in config/settings.py.
     @post: An instance of PlateAPI is created with a loaded recognizer and registered routes.
+    @post: Concurrent requests are coalesced into batches of up to `MAX_BATCH_SIZE` images.
+    @post: With `INFERENCE_PROCESS`, models live in one spawned process shared by all web workers.
     """
     def __init__(self):
         self.app = Flask(__name__)
+        if INFERENCE_PROCESS:
+            # Same process() contract as BatchCoalescer; images travel via shared memory.
+            self.recognizer = None
+            self.batcher = InferenceServer(
+                PlateRecognizer,
+                {"yolo_model_name": YOLO_MODEL_PATH, "ocr_model_name": OCR_MODEL_NAME, "warmup": True},
+                max_batch_size=MAX_BATCH_SIZE,
+                max_wait_ms=BATCH_WINDOW_MS,
+            )
+            self._register_routes()
+            return
+
         self.recognizer = PlateRecognizer(
             yolo_model_name=YOLO_MODEL_PATH,
             ocr_model_name=OCR_MODEL_NAME,
+            warmup=True,
         )
+        self.batcher = BatchCoalescer(
+            self.recognizer.process_batch,
+            max_batch_size=MAX_BATCH_SIZE,
+            max_wait_ms=BATCH_WINDOW_MS,
+        )
+        self._warmup()
         self._register_routes()
 
+    def _warmup(self):
+        """
+        Runs full-size dummy batches through YOLO and OCR so CuDNN autotuning happens before the first request.
+
+        The recognizer has already warmed up at batch size 1; this covers `MAX_BATCH_SIZE`.
+
+        @pre: `self.recognizer` must be initialized.
+        @post: Models are loaded and kernels selected for a batch of `MAX_BATCH_SIZE`.
+        """
+        width, height = YOLO_OUTPUT_SIZE
+        dummy = np.zeros((MAX_BATCH_SIZE, height, width, 3), dtype=np.uint8)
+        self.recognizer.process(dummy[0])
+        self.recognizer.process_batch(list(dummy))
+        # Blank frames yield no detections, so OCR is warmed up on its own.
+        self.recognizer.ocr.warmup(batch_size=MAX_BATCH_SIZE, size=YOLO_OUTPUT_SIZE)
+
     def _register_routes(self):
         """
         Maps URL endpoints to their specific view functions.
@@ -42,8 +103,7 @@ class PlateAPI:
         else:
             raw = str(text)
 
-        clean = raw.replace("_", "").replace(" ", "").replace("O", "0").replace("o", "0").replace("i", "1").replace("I", "1")
-        return clean
+        return normalize_plate_text(raw)
 
     def recognize(self):
         """
@@ -61,14 +121,16 @@ class PlateAPI:
                 return jsonify({"success": False, "error": "No image uploaded"}), 400
 
             # Decode image
-            np_arr = np.frombuffer(img_bytes.read(), np.uint8)
-            image = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+            image = decode_image(img_bytes.read())
             if image is None:
                 return jsonify({"success": False, "error": "Invalid image format"}), 400
 
-            # Run recognition
-            text, conf = self.recognizer.process(image)
-            confidence = conf[0]
+            # Run recognition (batched with concurrent requests)
+            result = self.batcher.process(image)
+            if result is None:
+                # A plate was detected but OCR could not read it.
+                return jsonify({"success": True, "plateFound": False}), 200
+            text, conf = result
 
             if not text:
                 return jsonify({"success": True, "plateFound": False}), 200
@@ -86,6 +148,8 @@ class PlateAPI:
             if not clean_text:
                 return jsonify({"success": True, "plateFound": False}), 200
 
+            # Detections carry the confidence as a one-element list.
+            confidence = conf[0] if isinstance(conf, (list, tuple)) else conf
             return jsonify({
                 "success": True,
                 "plateFound": True,
@@ -93,9 +157,8 @@ class PlateAPI:
                 "confidence": float(confidence),
             }), 200
 
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Plate recognition failed")
             return jsonify({"success": False, "error": "internal_error"}), 500
 
     def run(self, host="0.0.0.0", port=9000):
@@ -2,11 +2,12 @@
 Project-wide settings for license plate recognition.
 
 Preconditions:
-    - YOLO model must exist at YOLO_MODEL_PATH.
+    - YOLO model must exist at YOLO_MODEL_PATH, or a GPU-tagged TensorRT engine next to it.
 Postconditions:
     - Provides standardized paths and configuration constants for the project.
 """
 
+import glob
 import os
 
 # --- Directory Paths ---
@@ -15,7 +16,18 @@ SRC_DIR = os.path.dirname(CONFIG_DIR)                    # src/
 PROJECT_ROOT = os.path.dirname(SRC_DIR)                 # project root
 
 # --- Model Path ---
-YOLO_MODEL_PATH = os.path.join(SRC_DIR, "models", "best.pt")
+YOLO_WEIGHTS_PATH = os.path.join(SRC_DIR, "models", "best.pt")
+YOLO_OPENVINO_INT8_PATH = os.path.join(SRC_DIR, "models", "best_int8_openvino_model")  # OpenVINO INT8 export (CPU)
+YOLO_ONNX_PATH = os.path.join(SRC_DIR, "models", "best.onnx")                        # ONNX export (CPU-only hosts)
+# TensorRT exports are keyed on the GPU model: best.<gpu>.engine (FP16) / best.<gpu>.int8.engine (INT8).
+YOLO_GPU_ENGINE_GLOB = os.path.join(SRC_DIR, "models", "best.*.engine")
+
+# Prefer an exported artifact (see PlateProcessor/model_export.py) over the raw weights, fastest first.
+# The engine built for the local GPU, if any, is picked on top of this by YOLODetector.resolve_model_path.
+YOLO_MODEL_PATH = next(
+    (path for path in (YOLO_OPENVINO_INT8_PATH, YOLO_ONNX_PATH) if os.path.exists(path)),
+    YOLO_WEIGHTS_PATH,
+)
 
 # --- Test Data Directory ---
 TEST_DATA_DIR = os.path.join(PROJECT_ROOT, "Test_Data")
@@ -23,15 +35,27 @@ TEST_DATA_DIR = os.path.join(PROJECT_ROOT, "Test_Data")
 # --- Detection & OCR Settings ---
 PLATE_CLASS_ID = 0                        # YOLO class for license plates
 OCR_MODEL_NAME = "cct-xs-v1-global-model"  # fast-plate-ocr model name
+OCR_MODEL_DIR = os.path.join(SRC_DIR, "models", "ocr")  # local exports (TextExtraction/model_export.py)
 OCR_LANGS = ["en"]                         # Languages for OCR (future use)
 
 # YOLO detection/cropping parameters
 YOLO_EXPAND_RATIO = 0.001                  # Bounding box expansion fraction
 YOLO_OUTPUT_SIZE = (512, 256)             # (width, height) of cropped plates
+YOLO_IMGSZ = 640                           # model input size (square)
+YOLO_FUSED_PREPROCESS = False              # one-pass letterbox+normalize+CHW (PlateProcessor/preprocess.py)
+YOLO_BACKEND = "ultralytics"               # or "onnxruntime-int8": best.int8.onnx in an ORT session (CPU hosts)
+YOLO_USE_TENSORRT = False                  # build (once) and run a TensorRT FP16 engine from best.pt (CUDA hosts)
+YOLO_COMPILE = False                       # torch.compile best.pt (torch >= 2.0); frames are letterboxed to YOLO_IMGSZ
+YOLO_GPU_CROP = False                      # crop+resize plates on the GPU with torchvision roi_align (CUDA hosts)
+
+# Request batching (Flask /detect-plate)
+MAX_BATCH_SIZE = 8                         # max images per YOLO/OCR batch
+BATCH_WINDOW_MS = 5                        # time to wait for more requests after the first
+INFERENCE_PROCESS = False                  # one shared model process for all web workers (core/inference_server.py)
 
 # Image display settings
 SHOW_IMAGE_DELAY_MS = 2000                 # milliseconds to show images in utils
 
 # --- Preconditions Check ---
-if not os.path.exists(YOLO_MODEL_PATH):
+if not os.path.exists(YOLO_MODEL_PATH) and not glob.glob(YOLO_GPU_ENGINE_GLOB):
     raise FileNotFoundError(f"YOLO model not found: {YOLO_MODEL_PATH}")
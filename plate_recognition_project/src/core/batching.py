@@ -0,0 +1,128 @@
+"""
+Request coalescing: groups concurrent single-image requests into batches.
+
+A background worker drains a queue of (image, Future) pairs, waiting at most
+`max_wait_ms` after the first item for up to `max_batch_size` items, and runs
+them through one `process_batch` call so YOLO and OCR see a full batch instead
+of one image per request.
+
+@pre: `process_batch` returns exactly one result per input image, in order.
+@post: Every submitted Future is resolved with its image's result or the batch's exception.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+
+class BatchCoalescer:
+    """
+    Background batcher in front of a batched inference function.
+
+    @pre: `max_batch_size` >= 1 and `max_wait_ms` >= 0.
+    @post: A daemon worker thread is started and consumes submitted images.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[np.ndarray]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """
+        Initializes the batcher and starts its worker thread.
+
+        @param process_batch: Function mapping a list of images to a list of results.
+        @param max_batch_size: Maximum number of images per batch.
+        @param max_wait_ms: Time window after the first queued image to collect more.
+        @post: `self._worker` is running.
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="plate-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, image: np.ndarray) -> Future:
+        """
+        Queues an image for batched processing.
+
+        @param image: BGR image as a numpy array.
+        @return: Future resolved with the image's result.
+        """
+        future: Future = Future()
+        self._queue.put((image, future))
+        return future
+
+    def process(self, image: np.ndarray, timeout: Optional[float] = None) -> Any:
+        """
+        Queues an image and blocks until its result is available.
+
+        @param image: BGR image as a numpy array.
+        @param timeout: Seconds to wait for the result (None waits forever).
+        @return: The result produced by `process_batch` for this image.
+        @raises Exception: Whatever `process_batch` raised for the batch.
+        """
+        return self.submit(image).result(timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Stops the worker once already queued images are processed.
+
+        @post: The worker thread has exited.
+        """
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self) -> Optional[list]:
+        """
+        Blocks for the first item, then gathers more until the batch is full or the window closes.
+
+        @return: List of (image, Future) pairs, or None when the batcher is closing.
+        """
+        first = self._queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Re-queue the sentinel so the loop exits after this batch.
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        """
+        Worker loop: collect a batch, run it, resolve the futures.
+        """
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            images = [image for image, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                results = self.process_batch(images)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            for future, result in zip(futures, results):
+                future.set_result(result)
@@ -0,0 +1,256 @@
+"""
+Inference process: one model owner shared by every web worker.
+
+When the API runs under several Gunicorn workers, each worker would otherwise
+load its own YOLO + OCR models onto the GPU. Instead, a single spawned process
+owns the recognizer and batches requests from all workers:
+
+    web worker                              inference process
+    ----------                              -----------------
+    image -> SharedMemory block  ---(name, shape, dtype, id)--->  copy out, close
+                                                                  BatchCoalescer -> process_batch
+    Future resolved by reply thread  <---(id, result)---  per-worker reply queue
+
+Only the shared-memory block name and metadata cross the request queue, so the
+image bytes are not pickled.
+
+@pre: The server is created in the parent process before web workers fork (Gunicorn --preload).
+@post: GPU memory use does not depend on the number of web workers.
+"""
+
+import logging
+import multiprocessing as mp
+import os
+import threading
+import uuid
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from core.batching import BatchCoalescer
+
+# Finite by default so a dead inference process fails the request instead of hanging its thread.
+DEFAULT_TIMEOUT_S = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def _serve(requests, recognizer_factory: Callable, recognizer_kwargs: dict, max_batch_size: int, max_wait_ms: float) -> None:
+    """
+    Inference process main loop.
+
+    @param requests: Queue of (request_id, shm_name, shape, dtype, reply_queue) tuples; None stops the loop.
+    @param recognizer_factory: Callable building an object with `process_batch(images)`.
+    @param recognizer_kwargs: Keyword arguments for `recognizer_factory`.
+    @param max_batch_size: Maximum images per batch.
+    @param max_wait_ms: Batching window after the first queued image.
+    @post: A recognizer that fails to load, or a request whose image cannot be read, is answered with an error.
+    """
+    try:
+        recognizer = recognizer_factory(**recognizer_kwargs)
+    except Exception as e:
+        logger.exception("Inference process failed to load the recognizer")
+        _reject_all(requests, f"recognizer failed to load: {type(e).__name__}: {e}")
+        return
+    batcher = BatchCoalescer(recognizer.process_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    while True:
+        item = requests.get()
+        if item is None:
+            batcher.close()
+            return
+
+        request_id, shm_name, shape, dtype, reply = item
+        try:
+            image = _read_shared(shm_name, shape, dtype)
+        except Exception as e:
+            # e.g. the client timed out and unlinked the block before we attached to it.
+            reply.put((request_id, (False, f"{type(e).__name__}: {e}")))
+            continue
+
+        future = batcher.submit(image)
+        future.add_done_callback(lambda f, rid=request_id, q=reply: q.put((rid, _outcome(f))))
+
+
+def _read_shared(shm_name: str, shape: tuple, dtype: str) -> np.ndarray:
+    """
+    Copies an image out of a shared-memory block.
+
+    @param shm_name: Name of the block created by the web worker.
+    @param shape: Image shape.
+    @param dtype: Image dtype string.
+    @return: Private copy of the image, so the block can be released as soon as we reply.
+    @raises FileNotFoundError: If the block no longer exists.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+
+
+def _reject_all(requests, message: str) -> None:
+    """
+    Answers every request with an error until the stop sentinel arrives.
+
+    @param requests: Queue of request tuples; None stops the loop.
+    @param message: Error message sent back for each request.
+    """
+    while True:
+        item = requests.get()
+        if item is None:
+            return
+        request_id, _, _, _, reply = item
+        reply.put((request_id, (False, message)))
+
+
+def _outcome(future: Future) -> tuple:
+    """
+    Converts a finished Future into a picklable (ok, payload) pair.
+
+    @param future: Completed Future from the batcher.
+    @return: (True, result) on success, (False, error message) on failure.
+    """
+    try:
+        return True, future.result()
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+class InferenceClient:
+    """
+    Web-worker side of the inference process.
+
+    @pre: Created in the process that will use it (one per web worker).
+    @post: A daemon thread routes replies to the waiting request threads.
+    """
+
+    def __init__(self, requests, manager) -> None:
+        """
+        Initializes the client with its own reply queue.
+
+        @param requests: Shared request queue of the InferenceServer.
+        @param manager: multiprocessing Manager used to create a picklable reply queue.
+        """
+        self._requests = requests
+        self._reply = manager.Queue()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_replies, name="inference-replies", daemon=True)
+        self._reader.start()
+
+    def process(self, image: np.ndarray, timeout: Optional[float] = DEFAULT_TIMEOUT_S) -> Any:
+        """
+        Sends an image to the inference process and blocks for its result.
+
+        @param image: BGR image as a numpy array.
+        @param timeout: Seconds to wait for the result (None waits forever).
+        @return: Result of `process_batch` for this image.
+        @raises RuntimeError: If the inference process failed on this image or could not load its models.
+        @raises TimeoutError: If no reply arrives within `timeout` (e.g. the inference process died).
+        """
+        image = np.ascontiguousarray(image)
+        shm = SharedMemory(create=True, size=max(image.nbytes, 1))
+        request_id = uuid.uuid4().hex
+        future: Future = Future()
+        try:
+            np.ndarray(image.shape, dtype=image.dtype, buffer=shm.buf)[:] = image
+            with self._lock:
+                self._pending[request_id] = future
+            self._requests.put((request_id, shm.name, image.shape, image.dtype.str, self._reply))
+            ok, payload = future.result(timeout=timeout)
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            shm.close()
+            shm.unlink()
+
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    def _read_replies(self) -> None:
+        """
+        Resolves pending Futures as replies arrive; exits when the manager shuts down.
+        """
+        while True:
+            try:
+                request_id, outcome = self._reply.get()
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                future = self._pending.get(request_id)
+            if future is not None:
+                future.set_result(outcome)
+
+
+class InferenceServer:
+    """
+    Spawns and owns the inference process.
+
+    @pre: `recognizer_factory` and its kwargs must be picklable (module-level callables).
+    @post: The inference process is running and accepting requests.
+    """
+
+    def __init__(
+        self,
+        recognizer_factory: Callable,
+        recognizer_kwargs: Optional[dict] = None,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """
+        Starts the inference process.
+
+        @param recognizer_factory: Callable building an object with `process_batch(images)`, e.g. PlateRecognizer.
+        @param recognizer_kwargs: Keyword arguments for `recognizer_factory`.
+        @param max_batch_size: Maximum images per batch.
+        @param max_wait_ms: Batching window after the first queued image.
+        """
+        # CUDA cannot be re-initialized in a forked child, so the model owner is spawned.
+        ctx = mp.get_context("spawn")
+        self._manager = ctx.Manager()
+        self._requests = ctx.Queue()
+        self._process = ctx.Process(
+            target=_serve,
+            args=(self._requests, recognizer_factory, recognizer_kwargs or {}, max_batch_size, max_wait_ms),
+            name="plate-inference",
+            daemon=True,
+        )
+        self._process.start()
+        self._clients: Dict[int, InferenceClient] = {}
+        self._clients_lock = threading.Lock()
+
+    def client(self) -> InferenceClient:
+        """
+        Returns the InferenceClient for the calling process, creating it on first use.
+
+        @return: Client bound to the current process id.
+        """
+        pid = os.getpid()
+        with self._clients_lock:
+            if pid not in self._clients:
+                self._clients[pid] = InferenceClient(self._requests, self._manager)
+            return self._clients[pid]
+
+    def process(self, image: np.ndarray, timeout: Optional[float] = DEFAULT_TIMEOUT_S) -> Any:
+        """
+        Runs one image through the inference process (same contract as BatchCoalescer.process).
+
+        @param image: BGR image as a numpy array.
+        @param timeout: Seconds to wait for the result (None waits forever).
+        @return: Result of `process_batch` for this image.
+        """
+        return self.client().process(image, timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Stops the inference process and the manager.
+
+        @post: The inference process has exited.
+        """
+        self._requests.put(None)
+        self._process.join()
+        self._manager.shutdown()
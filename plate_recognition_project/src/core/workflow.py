@@ -8,14 +8,21 @@ it, and extracts text using OCR.
 @post: Returns OCR text and confidence as a tuple. Confidence is 0.0 if detection or OCR fails.
 """
 
+import logging
 import os
 import numpy as np
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from PlateProcessor.yolo_detector import YOLODetector
 from TextExtraction.ocr_reader import OCRReader
 from utils.image_utils import load_image, show_image
-from config.settings import YOLO_EXPAND_RATIO, YOLO_OUTPUT_SIZE,SHOW_IMAGE_DELAY_MS
+from config.settings import YOLO_EXPAND_RATIO, YOLO_OUTPUT_SIZE,SHOW_IMAGE_DELAY_MS, PLATE_CLASS_ID
+from config.settings import YOLO_IMGSZ, YOLO_FUSED_PREPROCESS, YOLO_GPU_CROP, YOLO_USE_TENSORRT, YOLO_BACKEND, YOLO_COMPILE, OCR_MODEL_DIR
+
+logger = logging.getLogger(__name__)
+
+# Release builds never open debug windows, even if a caller passes DEBUG=True to process().
+DEBUG_IMAGES = False
 
 
 class PlateRecognizer:
@@ -26,21 +33,40 @@ class PlateRecognizer:
     @post: `process` method returns detected text and confidence.
     """
 
-    def __init__(self, yolo_model_name: str = "best.pt", ocr_model_name: str = "cct-xs-v1-global-model") -> None:
+    def __init__(
+        self,
+        yolo_model_name: str = "best.pt",
+        ocr_model_name: str = "cct-xs-v1-global-model",
+        warmup: bool = False,
+    ) -> None:
         """
         Initialize YOLO and OCR components for the PlateRecognizer pipeline.
 
         @param yolo_model_name: Filename of the YOLO model weights (default: "best.pt").
         @param ocr_model_name: Name of the OCR model (default: "cct-xs-v1-global-model").
+        @param warmup: Run dummy YOLO and OCR passes so the first image is not slowed by initialization.
 
         @pre: YOLO model file must exist in ../models relative to this file.
         @pre: OCR model must be compatible with OCRReader class.
         @post: Sets `self.yolo_model_path` to the absolute path of the YOLO model.
+        @post: Initializes `self.detector` as a loaded YOLODetector reused by every call.
         @post: Initializes `self.ocr` as a ready-to-use OCRReader instance.
         """
         base_dir = os.path.dirname(os.path.abspath(__file__))
         self.yolo_model_path = os.path.join(base_dir, "..", "models", yolo_model_name)
-        self.ocr = OCRReader(model_name=ocr_model_name)
+        self.detector = YOLODetector(
+            model_path=self.yolo_model_path,
+            plate_class_id=PLATE_CLASS_ID,
+            fused_preprocess=YOLO_FUSED_PREPROCESS,
+            imgsz=YOLO_IMGSZ,
+            warmup=warmup,
+            use_tensorrt=YOLO_USE_TENSORRT,
+            backend=YOLO_BACKEND,
+            compile_model=YOLO_COMPILE,
+        )
+        self.ocr = OCRReader(model_name=ocr_model_name, model_dir=OCR_MODEL_DIR)
+        if warmup:
+            self.ocr.warmup(size=YOLO_OUTPUT_SIZE)
 
     def process(self, image: np.ndarray, DEBUG: bool = False) -> Tuple[str, float]:
         """
@@ -57,19 +83,17 @@ class PlateRecognizer:
             raise SystemExit("ERROR: Input image is invalid.")
 
         # Step 1 — YOLO detection + optional cropping
-        cropped_plate, confidence = YOLODetector.detect_plate_yolo(
+        detection = self.detector.detect_and_crop(
             image,
-            self.yolo_model_path,
             expand_ratio=YOLO_EXPAND_RATIO,
             output_size=YOLO_OUTPUT_SIZE
         )
-        if cropped_plate is not None:
-             input_img = cropped_plate 
-        else:
+        if detection is None:
             return "No text detected.", 0.0
+        input_img, confidence = detection
 
-        # Step 2 — Show image if DEBUG
-        if DEBUG:
+        # Step 2 — Show image if DEBUG (debug builds only)
+        if DEBUG and DEBUG_IMAGES:
             show_image(input_img, window_name="Detected Plate", delay_ms=SHOW_IMAGE_DELAY_MS)
 
         # Step 3 — OCR extraction
@@ -77,13 +101,45 @@ class PlateRecognizer:
         if result:
             text, _ = result
             if DEBUG:
-                print(f"INFO: OCR result: {text} (confidence: {confidence:.2f}%)")
+                logger.info("OCR result: %s (confidence: %s)", text, confidence)
             return text, confidence
 
         if DEBUG:
-            print("WARNING: OCR failed to extract text.")
+            logger.warning("OCR failed to extract text.")
         return None
 
+    def process_batch(self, images: List[np.ndarray]) -> List[Optional[Tuple[str, float]]]:
+        """
+        Detect and extract plate text from several images with one batched YOLO call and one batched OCR call.
+
+        @param images: Input BGR images as numpy arrays.
+        @pre: Every image is not None and has size > 0.
+        @post: Returns one entry per image, in order, matching what `process` returns for it.
+
+        @return: List of (text, confidence) tuples, or None where OCR failed.
+        """
+        detections = self.detector.detect_plates(images)
+        results: List[Optional[Tuple[str, float]]] = [("No text detected.", 0.0)] * len(images)
+
+        found = [i for i, boxes in enumerate(detections) if boxes]
+        frames = [images[i] for i in found]
+        boxes = [detections[i][0].xyxy[0] for i in found]
+        if YOLO_GPU_CROP:
+            crops = YOLODetector.expand_and_crop_batch_gpu(frames, boxes, YOLO_EXPAND_RATIO, YOLO_OUTPUT_SIZE)
+        else:
+            # Expand all plate boxes in one array operation, each clipped to its own frame.
+            expanded = YOLODetector.expand_boxes(boxes, [frame.shape[1::-1] for frame in frames], YOLO_EXPAND_RATIO)
+            crops = [
+                YOLODetector.crop_and_resize(frame, box, YOLO_OUTPUT_SIZE)
+                for frame, box in zip(frames, expanded)
+            ]
+
+        # One OCR call for every plate found in the batch.
+        for i, result in zip(found, self.ocr.extract_text_batch(crops)):
+            results[i] = (result[0], detections[i][0].conf) if result else None
+
+        return results
+
 
 def _main() -> None:  # pragma: no cover
     """
@@ -0,0 +1,22 @@
+"""
+Plate text normalization.
+
+Drops separators ("_", " ") and fixes O/0 and I/1 confusions in OCR output
+with a single str.translate pass over a precomputed table.
+
+This module uses JavaDoc-style docstrings with @param and @return.
+"""
+
+_PLATE_TRANS = str.maketrans({"_": "", " ": "", "O": "0", "o": "0", "i": "1", "I": "1"})
+
+
+def normalize_plate_text(raw: str) -> str:
+    """
+    Removes separators and fixes O/0, I/1 confusions in OCR output.
+
+    @param raw: OCR text
+    @return: Normalized text (may be empty)
+    """
+    if not raw:
+        return ""
+    return raw.translate(_PLATE_TRANS)
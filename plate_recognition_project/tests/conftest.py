@@ -0,0 +1,17 @@
+import importlib.util
+import os
+import sys
+import types
+
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def pytest_configure(config):
+    """Runs once per session: make src importable and stub ultralytics when it is not installed."""
+    if PROJECT_SRC not in sys.path:
+        sys.path.insert(0, PROJECT_SRC)
+
+    if importlib.util.find_spec("ultralytics") is None:
+        ultralytics_stub = types.ModuleType("ultralytics")
+        ultralytics_stub.YOLO = lambda *args, **kwargs: None
+        sys.modules.setdefault("ultralytics", ultralytics_stub)
@@ -0,0 +1,81 @@
+import io
+import sys
+import types
+
+import cv2
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """PlateAPI with its routes registered and a stub batcher instead of the loaded models."""
+    settings_stub = types.ModuleType("config.settings")
+    settings_stub.__dict__.update(
+        YOLO_MODEL_PATH="dummy.pt",
+        OCR_MODEL_NAME="model",
+        YOLO_OUTPUT_SIZE=(10, 5),
+        YOLO_EXPAND_RATIO=0.1,
+        YOLO_IMGSZ=640,
+        YOLO_FUSED_PREPROCESS=False,
+        YOLO_GPU_CROP=False,
+        YOLO_USE_TENSORRT=False,
+        YOLO_BACKEND="ultralytics",
+        YOLO_COMPILE=False,
+        SHOW_IMAGE_DELAY_MS=50,
+        PLATE_CLASS_ID=0,
+        OCR_MODEL_DIR="models/ocr",
+        MAX_BATCH_SIZE=4,
+        BATCH_WINDOW_MS=5,
+        INFERENCE_PROCESS=False,
+    )
+    monkeypatch.setitem(sys.modules, "config", types.ModuleType("config"))
+    monkeypatch.setitem(sys.modules, "config.settings", settings_stub)
+    try:
+        import fast_plate_ocr  # noqa: F401
+    except ImportError:
+        fpo_stub = types.ModuleType("fast_plate_ocr")
+        fpo_stub.LicensePlateRecognizer = object
+        monkeypatch.setitem(sys.modules, "fast_plate_ocr", fpo_stub)
+
+    # Import app and core.workflow against the stub; monkeypatch restores the previous modules afterwards.
+    import core
+
+    rebound = ("app", "core.workflow")
+    for name in rebound:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.setattr(core, "workflow", None, raising=False)
+    import app
+
+    plate_api = app.PlateAPI.__new__(app.PlateAPI)
+    plate_api.app = app.Flask(app.__name__)
+    plate_api._register_routes()
+    yield plate_api
+
+    for name in rebound:
+        sys.modules.pop(name, None)
+
+
+def _post(api, result):
+    api.batcher = types.SimpleNamespace(process=lambda image: result)
+    _, jpeg = cv2.imencode(".jpg", np.zeros((16, 16, 3), dtype=np.uint8))
+    files = {"image": (io.BytesIO(jpeg.tobytes()), "frame.jpg")}
+    response = api.app.test_client().post("/detect-plate", data=files, content_type="multipart/form-data")
+    return response.status_code, response.get_json()
+
+
+def test_recognize_without_plate_returns_not_found(api):
+    assert _post(api, ("No text detected.", 0.0)) == (200, {"success": True, "plateFound": False})
+
+
+def test_recognize_with_unreadable_plate_returns_not_found(api):
+    assert _post(api, None) == (200, {"success": True, "plateFound": False})
+
+
+def test_recognize_returns_plate_and_confidence(api):
+    status, body = _post(api, ("AB C12_3", [0.9]))
+
+    assert status == 200
+    assert body["plateFound"] is True
+    assert body["licenseNumber"] == "ABC123"
+    assert body["confidence"] == pytest.approx(0.9)
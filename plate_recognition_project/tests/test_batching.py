@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import numpy as np
+import pytest
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+from core.batching import BatchCoalescer
+
+
+def test_concurrent_submissions_are_batched_in_order():
+    batches = []
+    release = threading.Event()
+
+    def process_batch(images):
+        release.wait(timeout=1)
+        batches.append(len(images))
+        return [int(img[0, 0, 0]) for img in images]
+
+    batcher = BatchCoalescer(process_batch, max_batch_size=4, max_wait_ms=200)
+    futures = [batcher.submit(np.full((2, 2, 3), i, dtype=np.uint8)) for i in range(4)]
+    release.set()
+
+    assert [f.result(timeout=2) for f in futures] == [0, 1, 2, 3]
+    assert batches == [4]
+    batcher.close()
+
+
+def test_batch_size_is_capped():
+    batches = []
+
+    def process_batch(images):
+        batches.append(len(images))
+        return [None] * len(images)
+
+    batcher = BatchCoalescer(process_batch, max_batch_size=2, max_wait_ms=50)
+    futures = [batcher.submit(np.zeros((1, 1, 3), dtype=np.uint8)) for _ in range(5)]
+    for f in futures:
+        f.result(timeout=2)
+
+    assert max(batches) <= 2
+    assert sum(batches) == 5
+    batcher.close()
+
+
+def test_batch_exception_propagates_to_every_caller():
+    def process_batch(images):
+        raise RuntimeError("inference failed")
+
+    batcher = BatchCoalescer(process_batch, max_batch_size=4, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError):
+        batcher.process(np.zeros((1, 1, 3), dtype=np.uint8), timeout=2)
+    batcher.close()
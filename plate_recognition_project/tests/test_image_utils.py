@@ -0,0 +1,72 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+import cv2
+import utils.image_utils as image_utils
+from utils.image_utils import decode_image
+
+
+def test_decode_image_round_trips_jpeg_and_png():
+    image = np.zeros((8, 16, 3), dtype=np.uint8)
+    image[:, :8] = (255, 0, 0)
+
+    for ext in (".jpg", ".png"):
+        ok, encoded = cv2.imencode(ext, image)
+        assert ok
+        decoded = decode_image(encoded.tobytes())
+        assert decoded.shape == (8, 16, 3)
+        assert decoded.flags["C_CONTIGUOUS"]
+        assert abs(int(decoded[0, 0, 0]) - 255) <= 2
+
+
+def _with_exif_orientation(jpeg: bytes, orientation: int) -> bytes:
+    # Big-endian TIFF header, IFD0 with a single SHORT orientation entry, no next IFD.
+    tiff = b"MM\x00\x2a\x00\x00\x00\x08" + b"\x00\x01"
+    tiff += b"\x01\x12\x00\x03\x00\x00\x00\x01" + orientation.to_bytes(2, "big") + b"\x00\x00"
+    tiff += b"\x00\x00\x00\x00"
+    app1 = b"Exif\x00\x00" + tiff
+    return jpeg[:2] + b"\xff\xe1" + (len(app1) + 2).to_bytes(2, "big") + app1 + jpeg[2:]
+
+
+def test_decode_image_applies_exif_orientation(monkeypatch):
+    ok, encoded = cv2.imencode(".jpg", np.zeros((20, 40, 3), dtype=np.uint8))
+    assert ok
+    rotated = _with_exif_orientation(encoded.tobytes(), 6)
+    assert image_utils._jpeg_orientation(rotated) == 6
+    assert image_utils._jpeg_orientation(encoded.tobytes()) == 1
+
+    class _ExifBlindDecoder:
+        def decode(self, data, pixel_format=None):
+            return np.zeros((20, 40, 3), dtype=np.uint8)
+
+    # The EXIF-blind fast decoder must not be used for the tagged JPEG.
+    monkeypatch.setattr(image_utils, "_tj", _ExifBlindDecoder())
+    monkeypatch.setattr(image_utils, "TJPF_BGR", 0, raising=False)
+
+    assert decode_image(rotated).shape == (40, 20, 3)
+
+
+def test_decode_image_rejects_empty_and_garbage():
+    assert decode_image(b"") is None
+    assert decode_image(b"not an image") is None
+
+
+def test_show_image_is_noop_when_headless(monkeypatch):
+    import utils.image_utils as image_utils
+
+    calls = []
+    monkeypatch.setattr(image_utils.cv2, "imshow", lambda *args: calls.append(args))
+    monkeypatch.setattr(image_utils.cv2, "waitKey", lambda *args: calls.append(args))
+    monkeypatch.setenv("HEADLESS", "1")
+
+    image_utils.show_image(np.zeros((2, 2, 3), dtype=np.uint8), delay_ms=2000)
+    monkeypatch.setenv("HEADLESS", "0")
+    image_utils.show_image(None)
+
+    assert calls == []
@@ -0,0 +1,77 @@
+import os
+import sys
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+from core.inference_server import InferenceServer
+
+
+class _SumRecognizer:
+    """Module-level so the spawned inference process can unpickle it."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def process_batch(self, images):
+        if self.fail:
+            raise ValueError("inference failed")
+        return [(int(img.sum()), img.shape) for img in images]
+
+
+class _BrokenRecognizer:
+    """Fails to load, like a missing model or a CUDA out-of-memory error."""
+
+    def __init__(self):
+        raise OSError("model not found")
+
+
+def test_images_roundtrip_through_shared_memory():
+    server = InferenceServer(_SumRecognizer, max_batch_size=4, max_wait_ms=1)
+    try:
+        image = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+        assert server.process(image, timeout=30) == (int(image.sum()), (2, 3, 3))
+    finally:
+        server.close()
+
+
+def test_remote_error_is_raised_in_caller():
+    server = InferenceServer(_SumRecognizer, {"fail": True}, max_batch_size=4, max_wait_ms=1)
+    try:
+        with pytest.raises(RuntimeError, match="inference failed"):
+            server.process(np.zeros((1, 1, 3), dtype=np.uint8), timeout=30)
+    finally:
+        server.close()
+
+
+def test_load_failure_is_reported_to_clients():
+    server = InferenceServer(_BrokenRecognizer, max_batch_size=4, max_wait_ms=1)
+    try:
+        with pytest.raises(RuntimeError, match="failed to load: OSError: model not found"):
+            server.process(np.zeros((1, 1, 3), dtype=np.uint8), timeout=30)
+    finally:
+        server.close()
+
+
+def test_missing_shared_memory_block_is_reported_and_server_keeps_serving():
+    server = InferenceServer(_SumRecognizer, max_batch_size=4, max_wait_ms=1)
+    try:
+        # A client that timed out has already unlinked its block when the request is read.
+        client = server.client()
+        stale = Future()
+        client._pending["stale"] = stale
+        server._requests.put(("stale", "psm_plate_missing", (1, 1, 3), "|u1", client._reply))
+
+        ok, message = stale.result(timeout=30)
+        assert not ok and message.startswith("FileNotFoundError")
+
+        image = np.ones((2, 2, 3), dtype=np.uint8)
+        assert server.process(image, timeout=30) == (12, (2, 2, 3))
+    finally:
+        server.close()
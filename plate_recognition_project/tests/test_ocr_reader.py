@@ -30,12 +30,14 @@ class _FakeRecognizer:
         self.run_calls += 1
         if self.raise_error:
             raise RuntimeError("fail")
+        if isinstance(img, list):
+            return [self.return_text for _ in img]
         return self.return_text
 
 
 def test_extract_text_success(monkeypatch):
     fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
-    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name: fake_recognizer)
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
     reader = OCRReader()
     img = np.ones((5, 5, 3), dtype=np.uint8)
 
@@ -46,7 +48,7 @@ def test_extract_text_success(monkeypatch):
 
 
 def test_extract_text_returns_none_on_empty_input(monkeypatch):
-    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name: _FakeRecognizer(name))
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: _FakeRecognizer(name))
     reader = OCRReader()
 
     assert reader.extract_text(None) is None
@@ -56,7 +58,7 @@ def test_extract_text_returns_none_on_empty_input(monkeypatch):
 def test_extract_text_handles_recognizer_error(monkeypatch):
     fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
     fake_recognizer.raise_error = True
-    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name: fake_recognizer)
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
     reader = OCRReader()
     img = np.ones((5, 5, 3), dtype=np.uint8)
 
@@ -67,9 +69,84 @@ def test_extract_text_handles_recognizer_error(monkeypatch):
 def test_extract_text_handles_empty_string(monkeypatch):
     fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
     fake_recognizer.return_text = ""
-    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name: fake_recognizer)
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
     reader = OCRReader()
     img = np.ones((2, 2, 3), dtype=np.uint8)
 
     assert reader.extract_text(img) is None
     assert fake_recognizer.run_calls == 1
+
+
+def test_extract_text_batch_uses_one_call_and_keeps_order(monkeypatch):
+    fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
+    reader = OCRReader()
+    imgs = [np.ones((5, 5, 3), dtype=np.uint8), None, np.ones((5, 5, 3), dtype=np.uint8)]
+
+    results = reader.extract_text_batch(imgs)
+
+    assert results == [("ABC123", 100.0), None, ("ABC123", 100.0)]
+    assert fake_recognizer.run_calls == 1
+
+
+def test_extract_text_batch_handles_recognizer_error(monkeypatch):
+    fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
+    fake_recognizer.raise_error = True
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
+    reader = OCRReader()
+
+    assert reader.extract_text_batch([np.ones((2, 2, 3), dtype=np.uint8)] * 2) == [None, None]
+    assert reader.extract_text_batch([]) == []
+
+
+def test_local_export_is_preferred_over_hub(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        "TextExtraction.ocr_reader.LicensePlateRecognizer",
+        lambda name, **kwargs: calls.append(kwargs) or _FakeRecognizer(name),
+    )
+    folder = tmp_path / "cct-xs-v1-global-model"
+    folder.mkdir()
+    (folder / "plate_config.yaml").write_text("")
+    (folder / "model.onnx").write_bytes(b"")
+
+    OCRReader(model_dir=str(tmp_path))
+    assert calls[-1]["onnx_model_path"] == str(folder / "model.onnx")
+
+    (folder / "model.optimized.onnx").write_bytes(b"")
+    OCRReader(model_dir=str(tmp_path))
+    assert calls[-1]["onnx_model_path"] == str(folder / "model.optimized.onnx")
+    assert calls[-1]["plate_config_path"] == str(folder / "plate_config.yaml")
+
+
+def test_warmup_runs_dummy_batch(monkeypatch):
+    fake_recognizer = _FakeRecognizer("cct-xs-v1-global-model")
+    monkeypatch.setattr("TextExtraction.ocr_reader.LicensePlateRecognizer", lambda name, **kwargs: fake_recognizer)
+    reader = OCRReader()
+
+    reader.warmup(batch_size=4, size=(64, 32))
+
+    assert fake_recognizer.run_calls == 1
+
+
+def test_fp16_export_is_only_used_with_cuda(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        "TextExtraction.ocr_reader.LicensePlateRecognizer",
+        lambda name, **kwargs: calls.append(kwargs) or _FakeRecognizer(name),
+    )
+    folder = tmp_path / "cct-xs-v1-global-model"
+    folder.mkdir()
+    (folder / "plate_config.yaml").write_text("")
+    (folder / "model.onnx").write_bytes(b"")
+    (folder / "model.fp16.onnx").write_bytes(b"")
+
+    ort = pytest.importorskip("onnxruntime")
+    monkeypatch.setattr(ort, "get_available_providers", lambda: ["CPUExecutionProvider"])
+    OCRReader(model_dir=str(tmp_path))
+    assert calls[-1]["onnx_model_path"] == str(folder / "model.onnx")
+
+    monkeypatch.setattr(ort, "get_available_providers", lambda: ["CUDAExecutionProvider", "CPUExecutionProvider"])
+    OCRReader(model_dir=str(tmp_path))
+    assert calls[-1]["onnx_model_path"] == str(folder / "model.fp16.onnx")
+    assert calls[-1]["providers"] == ["CUDAExecutionProvider", "CPUExecutionProvider"]
@@ -0,0 +1,53 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+ort = pytest.importorskip("onnxruntime")
+
+from PlateProcessor.onnx_backend import OnnxDetectionModel
+
+
+class _FakeInput:
+    name = "images"
+
+
+class _FakeSession:
+    """Returns a fixed (N, 4 + 2 classes, 3 anchors) prediction."""
+
+    def __init__(self, *args, **kwargs):
+        self.batches = []
+
+    def get_inputs(self):
+        return [_FakeInput()]
+
+    def run(self, output_names, feeds):
+        batch = feeds["images"]
+        self.batches.append(batch.shape)
+        # Anchors as columns: cx, cy, w, h, score(class 0), score(class 1)
+        anchors = np.array([
+            [320, 320, 100, 50, 0.9, 0.1],   # plate
+            [322, 321, 100, 50, 0.8, 0.1],   # overlapping duplicate, suppressed by NMS
+            [100, 100, 40, 40, 0.1, 0.95],   # other class
+        ], dtype=np.float32).T
+        return [np.repeat(anchors[None], batch.shape[0], axis=0)]
+
+
+def test_onnx_model_returns_filtered_boxes_in_image_coordinates(monkeypatch):
+    monkeypatch.setattr(ort, "InferenceSession", _FakeSession)
+    model = OnnxDetectionModel("dummy.int8.onnx", imgsz=640)
+
+    # 640x320 frame: ratio 1, 160 px of vertical letterbox padding.
+    results = model([np.zeros((320, 640, 3), dtype=np.uint8)] * 2, classes=[0])
+
+    assert model.session.batches == [(2, 3, 640, 640)]
+    assert len(results) == 2
+    boxes = results[0].boxes.cpu().numpy()
+    np.testing.assert_allclose(boxes.xyxy, [[270, 135, 370, 185]])
+    assert boxes.cls.tolist() == [0]
+    np.testing.assert_allclose(boxes.conf, [0.9])
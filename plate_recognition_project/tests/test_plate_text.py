@@ -0,0 +1,20 @@
+import os
+import sys
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+from utils.plate_text import normalize_plate_text
+
+
+def test_normalize_plate_text_drops_separators_and_fixes_confusions():
+    assert normalize_plate_text("AB_C 1O2i") == "ABC1021"
+    assert normalize_plate_text("Io_ ") == "10"
+    assert normalize_plate_text("__ __") == ""
+    assert normalize_plate_text("") == ""
+
+
+def test_normalize_plate_text_keeps_other_characters():
+    assert normalize_plate_text("ÖSTER 12") == "ÖSTER12"
@@ -0,0 +1,46 @@
+import os
+import sys
+import numpy as np
+
+# Ensure project src is importable.
+PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if PROJECT_SRC not in sys.path:
+    sys.path.insert(0, PROJECT_SRC)
+
+from PlateProcessor.preprocess import bgr_hwc_to_rgb_chw, letterbox, prepare_batch, unletterbox_boxes
+
+
+def test_bgr_hwc_to_rgb_chw_matches_separate_passes():
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(7, 5, 3), dtype=np.uint8)
+
+    expected = (image[:, :, ::-1].astype(np.float32) / 255.0).transpose(2, 0, 1)
+    out = bgr_hwc_to_rgb_chw(image)
+
+    assert out.dtype == np.float32
+    assert out.shape == (3, 7, 5)
+    np.testing.assert_allclose(out, expected, rtol=1e-6)
+
+
+def test_letterbox_keeps_aspect_ratio_and_boxes_map_back():
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    padded, ratio, pad = letterbox(image, imgsz=64)
+
+    assert padded.shape == (64, 64, 3)
+    assert ratio == 64 / 200
+    assert pad == (0, 16)
+
+    original = np.array([[20.0, 10.0, 120.0, 90.0]], dtype=np.float32)
+    model_coords = original * ratio + np.array([0, 16, 0, 16], dtype=np.float32)
+    np.testing.assert_allclose(unletterbox_boxes(model_coords, ratio, pad), original, rtol=1e-5)
+
+
+def test_prepare_batch_stacks_mixed_shapes():
+    images = [np.zeros((30, 40, 3), dtype=np.uint8), np.full((50, 20, 3), 255, dtype=np.uint8)]
+
+    batch, transforms = prepare_batch(images, imgsz=32)
+
+    assert batch.shape == (2, 3, 32, 32)
+    assert batch.dtype == np.float32
+    assert len(transforms) == 2
+    assert batch[1, :, 16, 16].tolist() == [1.0, 1.0, 1.0]
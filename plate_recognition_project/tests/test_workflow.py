@@ -15,6 +15,14 @@ settings_stub = types.ModuleType("config.settings")
 settings_stub.YOLO_EXPAND_RATIO = 0.1
 settings_stub.YOLO_OUTPUT_SIZE = (10, 5)
 settings_stub.SHOW_IMAGE_DELAY_MS = 50
+settings_stub.PLATE_CLASS_ID = 0
+settings_stub.YOLO_IMGSZ = 640
+settings_stub.YOLO_FUSED_PREPROCESS = False
+settings_stub.YOLO_GPU_CROP = False
+settings_stub.YOLO_USE_TENSORRT = False
+settings_stub.YOLO_BACKEND = "ultralytics"
+settings_stub.YOLO_COMPILE = False
+settings_stub.OCR_MODEL_DIR = "models/ocr"
 sys.modules["config"] = config_module
 sys.modules["config.settings"] = settings_stub
 
@@ -51,14 +59,28 @@ class _FakeOCR:
         self.calls += 1
         return self.return_value
 
+    def extract_text_batch(self, imgs):
+        self.calls += 1
+        return [self.return_value for _ in imgs]
+
+
+class _FakeDetector:
+    instances = 0
+
+    def __init__(self, **kwargs):
+        _FakeDetector.instances += 1
+        self.calls = 0
+        self.return_value = (np.ones((5, 10, 3), dtype=np.uint8), 99.0)
+
+    def detect_and_crop(self, image, expand_ratio, output_size):
+        self.calls += 1
+        return self.return_value
+
 
 def test_process_happy_path(monkeypatch):
     fake_ocr = _FakeOCR("model")
-    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name: fake_ocr)
-    monkeypatch.setattr(
-        "core.workflow.YOLODetector.detect_plate_yolo",
-        lambda image, model_path, expand_ratio, output_size: np.ones((5, 10, 3), dtype=np.uint8),
-    )
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: fake_ocr)
+    monkeypatch.setattr("core.workflow.YOLODetector", _FakeDetector)
 
     recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
     image = np.zeros((20, 20, 3), dtype=np.uint8)
@@ -69,14 +91,70 @@ def test_process_happy_path(monkeypatch):
     assert fake_ocr.calls == 1
 
 
-def test_process_no_detection_then_ocr_none(monkeypatch, capsys):
+def test_process_reuses_one_detector(monkeypatch):
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: _FakeOCR(model_name))
+    monkeypatch.setattr("core.workflow.YOLODetector", _FakeDetector)
+    before = _FakeDetector.instances
+
+    recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
+    image = np.zeros((20, 20, 3), dtype=np.uint8)
+    recognizer.process(image)
+    recognizer.process(image)
+
+    assert _FakeDetector.instances - before == 1
+    assert recognizer.detector.calls == 2
+
+
+def test_process_batch_runs_one_ocr_call_for_found_plates(monkeypatch):
+    class _Box:
+        def __init__(self):
+            self.xyxy = np.array([[2, 2, 8, 6]], dtype=float)
+            self.conf = [0.9]
+
+    class _BatchDetector(_FakeDetector):
+        expand_boxes = staticmethod(lambda boxes, image_sizes, expand_ratio: boxes)
+        crop_and_resize = staticmethod(lambda image, box, output_size: image)
+
+        def detect_plates(self, images):
+            self.calls += 1
+            return [[_Box()], [], [_Box()]]
+
+    fake_ocr = _FakeOCR("model")
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: fake_ocr)
+    monkeypatch.setattr("core.workflow.YOLODetector", _BatchDetector)
+
+    recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
+    images = [np.zeros((10, 10, 3), dtype=np.uint8)] * 3
+
+    results = recognizer.process_batch(images)
+
+    assert results == [("ABC123", [0.9]), ("No text detected.", 0.0), ("ABC123", [0.9])]
+    assert recognizer.detector.calls == 1
+    assert fake_ocr.calls == 1
+
+
+def test_process_no_detection_returns_sentinel(monkeypatch):
+    class _NoPlateDetector(_FakeDetector):
+        def detect_and_crop(self, image, expand_ratio, output_size):
+            self.calls += 1
+            return None
+
+    fake_ocr = _FakeOCR("model")
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: fake_ocr)
+    monkeypatch.setattr("core.workflow.YOLODetector", _NoPlateDetector)
+
+    recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
+    image = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    assert recognizer.process(image) == ("No text detected.", 0.0)
+    assert fake_ocr.calls == 0
+
+
+def test_process_ocr_failure_returns_none(monkeypatch, capsys):
     fake_ocr = _FakeOCR("model")
     fake_ocr.return_value = None
-    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name: fake_ocr)
-    monkeypatch.setattr(
-        "core.workflow.YOLODetector.detect_plate_yolo",
-        lambda image, model_path, expand_ratio, output_size: None,
-    )
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: fake_ocr)
+    monkeypatch.setattr("core.workflow.YOLODetector", _FakeDetector)
     monkeypatch.setattr("core.workflow.show_image", lambda *args, **kwargs: None)
 
     recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
@@ -87,7 +165,9 @@ def test_process_no_detection_then_ocr_none(monkeypatch, capsys):
     assert "OCR failed" in out or "WARNING" in out or out == ""
 
 
-def test_process_invalid_input_raises_system_exit():
+def test_process_invalid_input_raises_system_exit(monkeypatch):
+    monkeypatch.setattr("core.workflow.OCRReader", lambda model_name, **kwargs: _FakeOCR(model_name))
+    monkeypatch.setattr("core.workflow.YOLODetector", _FakeDetector)
     recognizer = PlateRecognizer(yolo_model_name="dummy.pt", ocr_model_name="model")
     with pytest.raises(SystemExit):
         recognizer.process(None)
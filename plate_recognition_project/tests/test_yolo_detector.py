@@ -1,29 +1,51 @@
+import contextlib
 import os
 import sys
+import time
 import types
+from concurrent.futures import ThreadPoolExecutor
+import cv2
 import numpy as np
 import pytest
 
-# Ensure project src is importable when running tests directly.
-PROJECT_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-if PROJECT_SRC not in sys.path:
-    sys.path.insert(0, PROJECT_SRC)
+from PlateProcessor.yolo_detector import YOLODetector, Box, BoxBatch, _get_detector
 
-# Provide a stub ultralytics module if the real package is unavailable.
-if "ultralytics" not in sys.modules:
-    ultralytics_stub = types.ModuleType("ultralytics")
-    ultralytics_stub.YOLO = lambda *args, **kwargs: None
-    sys.modules["ultralytics"] = ultralytics_stub
 
-from PlateProcessor.yolo_detector import YOLODetector, Box
+def _eq(a, b):
+    """Exact array equality as a raw byte compare, for small crops with known shape and dtype."""
+    assert a.shape == b.shape and a.dtype == b.dtype and a.tobytes() == b.tobytes()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_detector_cache():
+    """detect_plate_yolo caches detectors per model path; isolate tests from each other."""
+    _get_detector.cache_clear()
+    yield
+    _get_detector.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def zero_image():
+    """Shared read-only zero frames, allocated once per shape for the whole module."""
+    cache = {}
+
+    def _make(shape):
+        if shape not in cache:
+            image = np.zeros(shape, dtype=np.uint8)
+            image.setflags(write=False)
+            cache[shape] = image
+        return cache[shape]
+
+    return _make
 
 
 class _FakeBoxes:
     """Mimics ultralytics result boxes with cpu()->numpy() chain."""
 
-    def __init__(self, xyxy_array, cls_array):
+    def __init__(self, xyxy_array, cls_array, conf_array=None):
         self.xyxy = xyxy_array
         self.cls = cls_array
+        self.conf = conf_array if conf_array is not None else np.ones(len(cls_array))
 
     def cpu(self):
         return self
@@ -33,80 +55,291 @@ class _FakeBoxes:
 
 
 class _FakeResult:
-    def __init__(self, xyxy_array, cls_array):
-        self.boxes = _FakeBoxes(xyxy_array, cls_array)
+    def __init__(self, xyxy_array, cls_array, conf_array=None):
+        self.boxes = _FakeBoxes(xyxy_array, cls_array, conf_array)
+
+
+def _readonly(array):
+    array.setflags(write=False)
+    return array
 
 
 class _FakeModel:
-    """Stub YOLO model returning a single box."""
+    """Stub YOLO model returning a single box; the response is built once and shared by every call."""
+
+    _XYXY = _readonly(np.array([[10, 20, 50, 60]], dtype=np.float32))
+    _CLS = _readonly(np.array([2], dtype=np.float32))
+    _RESULTS = (_FakeResult(_XYXY, _CLS),)
 
     def __call__(self, image, classes=None):
-        xyxy = np.array([[10, 20, 50, 60]], dtype=float)
-        cls = np.array([2], dtype=float)
-        return [_FakeResult(xyxy, cls)]
+        return list(self._RESULTS)
+
+    def fuse(self):
+        pass
 
 
 def test_box_wraps_xyxy_and_cls():
-    box = Box((1, 2, 3, 4), 7)
+    box = Box((1, 2, 3, 4), 7, 0.75)
     assert box.xyxy.shape == (1, 4)
+    assert box.xyxy.dtype == np.float32
     assert box.cls == [7]
+    assert box.conf == [0.75]
     np.testing.assert_array_equal(box.xyxy[0], np.array([1, 2, 3, 4]))
 
 
-def test_detect_plate_returns_boxes(monkeypatch):
+def test_detect_plate_returns_boxes(monkeypatch, zero_image):
     monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _FakeModel())
     detector = YOLODetector(model_path="dummy", plate_class_id=2)
-    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    image = zero_image((100, 100, 3))
 
     boxes = detector.detect_plate(image)
 
     assert len(boxes) == 1
     assert isinstance(boxes[0], Box)
     np.testing.assert_array_equal(boxes[0].xyxy[0], np.array([10, 20, 50, 60]))
+    assert boxes[0].xyxy.dtype == np.float32
     assert boxes[0].cls == [2]
 
 
-def test_detect_plate_empty_results(monkeypatch):
+def test_detect_plate_stream_yields_in_order(monkeypatch):
+    class _StreamModel:
+        def __init__(self):
+            self.calls = []
+
+        def __call__(self, images, classes=None):
+            self.calls.append(len(images))
+            # One box per frame, placed at the frame's fill value.
+            return [
+                _FakeResult(np.array([[v, v, v + 1, v + 1]], dtype=np.float32), np.array([0.0]))
+                for v in (int(image[0, 0, 0]) for image in images)
+            ]
+
+    model = _StreamModel()
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: model)
+    detector = YOLODetector(model_path="dummy", plate_class_id=0)
+    frames = (np.full((8, 8, 3), i, dtype=np.uint8) for i in range(5))
+
+    out = list(detector.detect_plate_stream(frames, batch_size=2))
+
+    assert model.calls == [2, 2, 1]
+    assert [int(frame[0, 0, 0]) for frame, _ in out] == [0, 1, 2, 3, 4]
+    assert [boxes[0].xyxy[0, 0] for _, boxes in out] == [0, 1, 2, 3, 4]
+
+
+def test_detect_plate_reuses_class_filter(monkeypatch, zero_image):
+    seen = []
+
+    class _RecordingModel(_FakeModel):
+        def __call__(self, image, classes=None):
+            seen.append(classes)
+            return super().__call__(image, classes)
+
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _RecordingModel())
+    detector = YOLODetector(model_path="dummy", plate_class_id=2)
+    image = zero_image((10, 10, 3))
+
+    detector.detect_plate(image)
+    detector.detect_plate(image)
+
+    assert seen == [[2], [2]]
+    assert seen[0] is seen[1]
+
+
+def test_detect_plate_stream_hands_uploaded_batches_to_compute_stream(monkeypatch):
+    events = []
+    side = object()
+
+    class _DeviceBatch:
+        def pin_memory(self):
+            return self
+
+        def to(self, device, non_blocking=False):
+            events.append(("upload", device, non_blocking))
+            return self
+
+        def record_stream(self, stream):
+            events.append(("record", stream))
+
+    class _ComputeStream:
+        def wait_stream(self, stream):
+            events.append(("wait", stream))
+
+    compute = _ComputeStream()
+    torch_stub = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(
+            Stream=lambda: side,
+            current_stream=lambda: compute,
+            stream=lambda stream: contextlib.nullcontext(),
+        )
+    )
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _FakeModel())
+    detector = YOLODetector(model_path="dummy", plate_class_id=2, fused_preprocess=True)
+    detector.channels_last = True  # PyTorch weights on CUDA
+    monkeypatch.setattr(detector, "_model_input", lambda images: (_DeviceBatch(), [(1.0, (0, 0))]))
+
+    out = list(detector.detect_plate_stream([np.zeros((8, 8, 3), dtype=np.uint8)]))
+
+    assert len(out) == 1
+    assert events == [("upload", "cuda", True), ("wait", side), ("record", compute)]
+
+
+def test_box_batch_indexes_into_shared_arrays():
+    xyxy = np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.float32)
+    batch = BoxBatch(xyxy, np.array([0.0, 2.0]), np.array([0.5, 0.9]))
+
+    assert len(batch) == 2
+    second = batch[1]
+    assert second.cls == [2] and second.conf == [0.9]
+    assert np.shares_memory(second.xyxy, xyxy)
+    assert [box.cls for box in batch] == [[0], [2]]
+    assert len(BoxBatch.empty()) == 0 and not BoxBatch.empty()
+
+
+def test_detect_plates_splits_batch_per_image(monkeypatch, zero_image):
+    class _BatchModel:
+        def __init__(self):
+            self.calls = []
+
+        def __call__(self, images, classes=None):
+            self.calls.append(len(images))
+            return [
+                _FakeResult(np.array([[1, 2, 3, 4]], dtype=float), np.array([0.0]), np.array([0.9])),
+                _FakeResult(np.zeros((0, 4)), np.zeros(0), np.zeros(0)),
+            ]
+
+    model = _BatchModel()
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: model)
+    detector = YOLODetector(model_path="dummy", plate_class_id=0)
+    images = [zero_image((50, 50, 3)), zero_image((30, 60, 3))]
+
+    batched = detector.detect_plates(images)
+
+    assert model.calls == [2]
+    assert len(batched) == 2
+    np.testing.assert_array_equal(batched[0][0].xyxy[0], np.array([1, 2, 3, 4]))
+    assert batched[0][0].conf == [0.9]
+    assert len(batched[1]) == 0
+
+    stacked = detector.detect_plate(zero_image((2, 40, 40, 3)))
+    assert model.calls == [2, 2]
+    assert len(stacked) == 2 and len(stacked[1]) == 0
+
+
+def test_detect_plates_yolo_crops_each_frame_from_one_call(monkeypatch, zero_image):
+    calls = []
+    monkeypatch.setattr(YOLODetector, "__init__", lambda self, model_path, plate_class_id: None)
+    monkeypatch.setattr(
+        YOLODetector,
+        "detect_plates",
+        lambda self, images: calls.append(len(images)) or [[Box((5, 5, 15, 15), 0, 0.8)], []],
+    )
+    monkeypatch.setattr(os.path, "exists", lambda _: True)
+
+    frames = zero_image((2, 40, 80, 3))
+    results = YOLODetector.detect_plates_yolo(frames, "dummy.pt", expand_ratio=0.1, output_size=(64, 32))
+
+    assert calls == [2]
+    assert results[0][0].shape == (32, 64, 3)
+    assert results[0][1] == [0.8]
+    assert results[1] is None
+
+
+def test_detect_plates_yolo_clips_each_box_to_its_own_frame(monkeypatch):
+    monkeypatch.setattr(YOLODetector, "__init__", lambda self, model_path, plate_class_id: None)
+    monkeypatch.setattr(
+        YOLODetector,
+        "detect_plates",
+        lambda self, images: [[Box((0, 0, 30, 20), 0, 0.8)], [Box((0, 0, 30, 20), 0, 0.7)]],
+    )
+    monkeypatch.setattr(os.path, "exists", lambda _: True)
+    rng = np.random.default_rng(0)
+    small = rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+    large = rng.integers(0, 256, size=(60, 90, 3), dtype=np.uint8)
+
+    results = YOLODetector.detect_plates_yolo([small, large], "dummy.pt", expand_ratio=0.5, output_size=(64, 32))
+
+    # Same box, different frame sizes: each matches the single-frame expand and crop.
+    for image, (crop, _) in zip((small, large), results):
+        _eq(crop, YOLODetector.expand_and_crop(image, (0, 0, 30, 20), 0.5, (64, 32)))
+
+
+def test_detect_plate_empty_results(monkeypatch, zero_image):
     class _EmptyModel:
         def __call__(self, image, classes=None):
             return []
 
     monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _EmptyModel())
     detector = YOLODetector(model_path="dummy", plate_class_id=2)
-    image = np.zeros((50, 50, 3), dtype=np.uint8)
+    image = zero_image((50, 50, 3))
 
     boxes = detector.detect_plate(image)
 
-    assert boxes == []
+    assert len(boxes) == 0
 
 
 def test_crop_plate_extracts_region():
     image = np.arange(10 * 10 * 3, dtype=np.uint8).reshape((10, 10, 3))
     cropped = YOLODetector.crop_plate(image, (2, 2, 5, 6))
     assert cropped.shape == (4, 3, 3)
-    np.testing.assert_array_equal(cropped[0, 0], image[2, 2])
-    np.testing.assert_array_equal(cropped[-1, -1], image[5, 4])
+    _eq(cropped[0, 0], image[2, 2])
+    _eq(cropped[-1, -1], image[5, 4])
+
+
+def test_crop_plate_tiled_matches_linear_crop():
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(70, 100, 3), dtype=np.uint8)
+    tiled = YOLODetector.tile_image(image, tile=32)
+    assert tiled.shape == (3, 4, 32, 32, 3)
+
+    for box in [(2, 2, 5, 6), (30, 10, 70, 45), (0, 0, 100, 70), (95, 60, 100, 70)]:
+        _eq(YOLODetector.crop_plate(tiled, box, tiled=True), YOLODetector.crop_plate(image, box))
+
+
+def test_expand_boxes_matches_per_box_expansion():
+    xyxy = np.array([[5, 5, 15, 15], [-3, 2, 50, 30], [70, 35, 79, 39], [10, 10, 10, 10]], dtype=np.float32)
+    sizes = [(80, 40), (40, 30), (80, 40), (20, 20)]
 
+    expanded = YOLODetector.expand_boxes(xyxy, sizes, 0.2)
 
-def test_detect_plate_yolo_returns_none_when_model_missing(monkeypatch):
+    assert expanded.dtype == np.int32
+    for row, box, (w, h) in zip(expanded, xyxy, sizes):
+        assert tuple(row.tolist()) == YOLODetector._expand_box(box, w, h, 0.2)
+    assert YOLODetector.expand_boxes(np.zeros((0, 4)), [], 0.2).shape == (0, 4)
+
+
+def test_crop_and_resize_umat_matches_numpy_path(monkeypatch):
+    monkeypatch.setattr(cv2.ocl, "haveOpenCL", lambda: True)
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(60, 90, 3), dtype=np.uint8)
+
+    for box, size in [((10, 20, 40, 35), (120, 60)), ((0, 0, 90, 60), (30, 20))]:
+        result = YOLODetector.crop_and_resize(image, box, size, use_umat=True)
+        x1, y1, x2, y2 = box
+        interpolation = cv2.INTER_AREA if y2 - y1 > size[1] else cv2.INTER_LINEAR
+        assert isinstance(result, np.ndarray)
+        _eq(result, cv2.resize(image[y1:y2, x1:x2], size, interpolation=interpolation))
+
+
+def test_detect_plate_yolo_returns_none_when_model_missing(monkeypatch, zero_image):
     monkeypatch.setattr(os.path, "exists", lambda _: False)
-    image = np.zeros((20, 20, 3), dtype=np.uint8)
+    image = zero_image((20, 20, 3))
 
     result = YOLODetector.detect_plate_yolo(image, "missing.pt")
 
     assert result is None
 
 
-def test_detect_plate_yolo_expands_and_resizes(monkeypatch):
+def test_detect_plate_yolo_expands_and_resizes(monkeypatch, zero_image):
     monkeypatch.setattr(YOLODetector, "__init__", lambda self, model_path, plate_class_id: None)
     monkeypatch.setattr(
         YOLODetector,
         "detect_plate",
-        lambda self, image: [Box((5, 5, 15, 15), 0)],
+        lambda self, image: [Box((5, 5, 15, 15), 0, 0.8)],
     )
     monkeypatch.setattr(os.path, "exists", lambda _: True)
 
-    image = np.zeros((40, 80, 3), dtype=np.uint8)
+    image = zero_image((40, 80, 3))
     result = YOLODetector.detect_plate_yolo(
         image,
         model_path="dummy.pt",
@@ -115,21 +348,23 @@ def test_detect_plate_yolo_expands_and_resizes(monkeypatch):
     )
 
     assert result is not None
-    assert result.shape == (32, 64, 3)
+    plate, conf = result
+    assert plate.shape == (32, 64, 3)
+    assert conf == [0.8]
 
 
-def test_detect_plate_yolo_no_boxes(monkeypatch):
+def test_detect_plate_yolo_no_boxes(monkeypatch, zero_image):
     monkeypatch.setattr(os.path, "exists", lambda _: True)
     monkeypatch.setattr(YOLODetector, "__init__", lambda self, model_path, plate_class_id: None)
     monkeypatch.setattr(YOLODetector, "detect_plate", lambda self, image: [])
 
-    image = np.zeros((10, 10, 3), dtype=np.uint8)
+    image = zero_image((10, 10, 3))
     result = YOLODetector.detect_plate_yolo(image, "dummy.pt")
 
     assert result is None
 
 
-def test_detect_plate_yolo_handles_init_failure(monkeypatch):
+def test_detect_plate_yolo_handles_init_failure(monkeypatch, zero_image):
     class _Boom(Exception):
         pass
 
@@ -139,5 +374,432 @@ def test_detect_plate_yolo_handles_init_failure(monkeypatch):
     monkeypatch.setattr(os.path, "exists", lambda _: True)
     monkeypatch.setattr(YOLODetector, "__init__", boom_init)
 
-    image = np.zeros((10, 10, 3), dtype=np.uint8)
+    image = zero_image((10, 10, 3))
     assert YOLODetector.detect_plate_yolo(image, "dummy.pt") is None
+
+
+def test_resolve_model_path_prefers_exported_engine(monkeypatch, tmp_path):
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: "nvidia_a10g")
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(weights)
+
+    (tmp_path / "best.onnx").write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.onnx")
+
+    # Untagged engines may come from another GPU and are never picked up.
+    (tmp_path / "best.engine").write_bytes(b"")
+    (tmp_path / "best.int8.engine").write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.onnx")
+
+    (tmp_path / "best.nvidia_a10g.engine").write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.nvidia_a10g.engine")
+
+    (tmp_path / "best.nvidia_a10g.int8.engine").write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.nvidia_a10g.int8.engine")
+
+
+def test_expand_and_crop_skips_resize_when_size_matches():
+    image = np.arange(40 * 80 * 3, dtype=np.uint8).reshape((40, 80, 3))
+
+    same = YOLODetector.expand_and_crop(image, (10, 5, 30, 15), 0.0, (20, 10))
+    _eq(same, image[5:15, 10:30])
+    assert same.flags["C_CONTIGUOUS"]
+
+    shrunk = YOLODetector.expand_and_crop(image, (0, 0, 80, 40), 0.0, (40, 20))
+    grown = YOLODetector.expand_and_crop(image, (0, 0, 8, 4), 0.0, (40, 20))
+    assert shrunk.shape == grown.shape == (20, 40, 3)
+
+
+def test_warmup_runs_one_dummy_forward_pass(monkeypatch):
+    calls = []
+
+    class _RecordingModel:
+        def __call__(self, image, classes=None):
+            calls.append((image.shape, classes))
+            return []
+
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _RecordingModel())
+
+    YOLODetector(model_path="dummy", plate_class_id=0)
+    assert calls == []
+
+    YOLODetector(model_path="dummy", plate_class_id=0, imgsz=320, warmup=True)
+    assert calls == [((320, 320, 3), [0])]
+
+
+def test_warmup_enables_cudnn_benchmark_only_for_static_shapes(monkeypatch):
+    torch_stub = types.SimpleNamespace(backends=types.SimpleNamespace(cudnn=types.SimpleNamespace(benchmark=False)))
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _FakeModel())
+
+    YOLODetector(model_path="dummy", plate_class_id=0, warmup=True)
+    assert not torch_stub.backends.cudnn.benchmark
+
+    detector = YOLODetector(model_path="dummy", plate_class_id=0, warmup=False, fused_preprocess=True)
+    detector.warmup()
+    assert torch_stub.backends.cudnn.benchmark
+
+
+def test_expand_and_crop_clips_and_never_returns_empty_crop():
+    image = np.arange(20 * 30 * 3, dtype=np.uint8).reshape((20, 30, 3))
+
+    expanded = YOLODetector.expand_and_crop(image, (10, 5, 20, 15), 0.5, (20, 20))
+    assert expanded.shape == (20, 20, 3)
+    _eq(expanded[0, 0], image[0, 5])
+
+    flipped = YOLODetector.expand_and_crop(image, (25, 18, 5, 2), 0.0, (8, 4))
+    outside = YOLODetector.expand_and_crop(image, (40, 30, 50, 40), 0.1, (8, 4))
+    assert flipped.shape == outside.shape == (4, 8, 3)
+
+
+def test_expand_and_crop_batch_gpu_matches_cpu_crop_shape():
+    pytest.importorskip("torchvision")
+    image = np.arange(40 * 80 * 3, dtype=np.uint8).reshape((40, 80, 3))
+
+    crops = YOLODetector.expand_and_crop_batch_gpu([image, image], [(10, 5, 30, 15), (0, 0, 80, 40)], 0.0, (20, 10), device="cpu")
+
+    assert [c.shape for c in crops] == [(10, 20, 3), (10, 20, 3)]
+    assert crops[0].dtype == np.uint8
+    np.testing.assert_array_equal(crops[0], image[5:15, 10:30])
+
+
+def test_resolve_model_path_prefers_engine_built_for_local_gpu(tmp_path, monkeypatch):
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"")
+    (tmp_path / "best.onnx").write_bytes(b"")
+    (tmp_path / "best.nvidia_t4.engine").write_bytes(b"")
+
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: "nvidia_a10g")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.onnx")
+
+    (tmp_path / "best.nvidia_a10g.engine").write_bytes(b"")
+    assert YOLODetector.resolve_model_path(str(weights)) == str(tmp_path / "best.nvidia_a10g.engine")
+    assert YOLODetector.resolve_model_path(str(tmp_path / "best.onnx")) == str(tmp_path / "best.nvidia_a10g.engine")
+
+
+def test_onnxruntime_int8_backend_loads_quantized_graph_for_any_export(monkeypatch, tmp_path):
+    loaded = []
+    monkeypatch.setattr(
+        "PlateProcessor.onnx_backend.OnnxDetectionModel", lambda path, imgsz: loaded.append(path) or _FakeModel()
+    )
+    (tmp_path / "best.int8.onnx").write_bytes(b"")
+
+    names = ("best.pt", "best.onnx", "best.int8.onnx", "best.int8.engine", "best.nvidia_a10g.engine", "best_int8_openvino_model")
+    for name in names:
+        YOLODetector(model_path=str(tmp_path / name), plate_class_id=0, backend="onnxruntime-int8")
+
+    assert loaded == [str(tmp_path / "best.int8.onnx")] * 6
+
+
+def test_use_tensorrt_loads_existing_engine_and_runs_half(monkeypatch, tmp_path, zero_image):
+    calls = []
+
+    class _HalfModel:
+        def __call__(self, image, classes=None, half=False):
+            calls.append(half)
+            return []
+
+    loaded = []
+    monkeypatch.setattr(
+        "PlateProcessor.yolo_detector.YOLO", lambda path, **kwargs: loaded.append(path) or _HalfModel()
+    )
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: "nvidia_a10g")
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"")
+    (tmp_path / "best.nvidia_a10g.engine").write_bytes(b"")
+
+    detector = YOLODetector(model_path=str(weights), plate_class_id=0, use_tensorrt=True)
+    detector.detect_plate(zero_image((10, 10, 3)))
+
+    assert loaded == [str(tmp_path / "best.nvidia_a10g.engine")]
+    assert calls == [True]
+
+
+def test_use_tensorrt_builds_from_weights_next_to_an_onnx_export(monkeypatch, tmp_path):
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: "nvidia_a10g")
+    loaded = []
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path, **kwargs: loaded.append(path) or object())
+    (tmp_path / "best.pt").write_bytes(b"")
+    (tmp_path / "best.nvidia_a10g.engine").write_bytes(b"")
+
+    detector = YOLODetector(model_path=str(tmp_path / "best.onnx"), plate_class_id=0, use_tensorrt=True)
+
+    assert loaded == [str(tmp_path / "best.nvidia_a10g.engine")]
+    assert detector.half
+
+
+def test_half_is_off_without_an_engine(monkeypatch, tmp_path):
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: None)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path, **kwargs: object())
+    (tmp_path / "best.onnx").write_bytes(b"")
+
+    detector = YOLODetector(model_path=str(tmp_path / "best.onnx"), plate_class_id=0)
+
+    assert not detector.half
+
+
+def test_ensure_engine_is_built_once_by_concurrent_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: "nvidia_a10g")
+    weights = tmp_path / "best.pt"
+    weights.write_bytes(b"")
+    engine = tmp_path / "best.nvidia_a10g.engine"
+    builds = []
+
+    def _export_engine(weights_path, imgsz):
+        builds.append(weights_path)
+        time.sleep(0.05)
+        engine.write_bytes(b"")
+        return str(engine)
+
+    monkeypatch.setattr("PlateProcessor.model_export.export_engine", _export_engine)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(pool.map(lambda _: YOLODetector._ensure_engine(str(weights), 640), range(4)))
+
+    assert builds == [str(weights)]
+    assert paths == [str(engine)] * 4
+
+
+def test_expand_and_crop_enlarge_matches_crop_then_resize():
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(60, 90, 3), dtype=np.uint8)
+
+    grown = YOLODetector.expand_and_crop(image, (10, 20, 40, 35), 0.0, (120, 60))
+    reference = cv2.resize(image[20:35, 10:40], (120, 60), interpolation=cv2.INTER_LINEAR)
+
+    # No pixels from outside the box are blended in, edges included.
+    _eq(grown, reference)
+
+
+def test_detect_plate_yolo_loads_model_once(monkeypatch, zero_image):
+    inits = []
+
+    def counting_init(self, model_path, plate_class_id):
+        inits.append(model_path)
+
+    monkeypatch.setattr(YOLODetector, "__init__", counting_init)
+    monkeypatch.setattr(YOLODetector, "detect_plate", lambda self, image: [Box((5, 5, 15, 15), 0, 0.9)])
+    monkeypatch.setattr(os.path, "exists", lambda _: True)
+
+    image = zero_image((40, 80, 3))
+    for _ in range(3):
+        assert YOLODetector.detect_plate_yolo(image, "dummy.pt") is not None
+
+    assert inits == ["dummy.pt"]
+
+
+def test_detect_plate_yolo_stats_model_path_only_on_first_load(monkeypatch, zero_image):
+    stats = []
+    monkeypatch.setattr(YOLODetector, "__init__", lambda self, model_path, plate_class_id: None)
+    monkeypatch.setattr(YOLODetector, "detect_plate", lambda self, image: [Box((5, 5, 15, 15), 0, 0.9)])
+    monkeypatch.setattr(os.path, "exists", lambda path: stats.append(path) or True)
+
+    image = zero_image((40, 80, 3))
+    for _ in range(3):
+        assert YOLODetector.detect_plate_yolo(image, "dummy.pt") is not None
+
+    assert stats == ["dummy.pt"]
+
+
+def test_pt_weights_enable_tf32_and_channels_last_on_cuda(monkeypatch):
+    calls = []
+    torch_stub = types.SimpleNamespace(
+        channels_last="channels_last",
+        cuda=types.SimpleNamespace(is_available=lambda: True),
+        backends=types.SimpleNamespace(cudnn=types.SimpleNamespace(allow_tf32=False)),
+        set_float32_matmul_precision=lambda precision: calls.append(precision),
+    )
+
+    class _Net:
+        def to(self, memory_format=None):
+            calls.append(memory_format)
+            return self
+
+    class _PtModel(_FakeModel):
+        model = _Net()
+
+        def fuse(self):
+            calls.append("fuse")
+
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: None)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _PtModel())
+
+    detector = YOLODetector(model_path="weights.pt", plate_class_id=2)
+
+    assert detector.channels_last
+    # Fused before the layout change, so the predictor's own fuse() has nothing left to replace.
+    assert calls == ["high", "fuse", "channels_last"]
+    assert torch_stub.backends.cudnn.allow_tf32
+
+
+def _compile_torch_stub(compiled_forward):
+    """torch stub whose compile() wraps any network in compiled_forward and records its kwargs."""
+    calls = []
+
+    class _Compiled:
+        def __init__(self, net):
+            self.net = net
+
+        def __call__(self, x):
+            calls.append(x.shape)
+            return compiled_forward(x)
+
+        def __getattr__(self, name):
+            # Like torch's OptimizedModule, unknown attributes come from the wrapped network.
+            return getattr(self.net, name)
+
+    torch_stub = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(is_available=lambda: False),
+        compile=lambda net, **kwargs: calls.append(kwargs) or _Compiled(net),
+        zeros=lambda shape, device=None, dtype=None: types.SimpleNamespace(shape=shape),
+        no_grad=contextlib.nullcontext,
+    )
+    return torch_stub, calls
+
+
+class _PtNet:
+    def parameters(self):
+        return iter([types.SimpleNamespace(device="cpu", dtype="float32")])
+
+    def fuse(self):
+        return self
+
+
+def test_compile_model_wraps_pt_network_and_fixes_input_size(monkeypatch):
+    torch_stub, calls = _compile_torch_stub(lambda x: x)
+    net = _PtNet()
+
+    class _PtModel(_FakeModel):
+        model = net
+
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: None)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _PtModel())
+
+    detector = YOLODetector(model_path="weights.pt", plate_class_id=2, imgsz=320, compile_model=True)
+
+    assert detector.compiled
+    assert detector.fused_preprocess
+    assert detector.model.model.net is net
+    # Compiled, then run once at the production input size before being installed.
+    assert calls == [{"mode": "reduce-overhead", "fullgraph": False}, (1, 3, 320, 320)]
+
+
+def test_predictor_runs_the_compiled_network(monkeypatch):
+    torch_stub, _ = _compile_torch_stub(lambda x: "compiled")
+    net = _PtNet()
+    fused = []
+
+    class _PtModel(_FakeModel):
+        model = net
+
+        def fuse(self):
+            fused.append(self.model)
+
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: None)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _PtModel())
+
+    detector = YOLODetector(model_path="weights.pt", plate_class_id=2, compile_model=True)
+    # What the ultralytics predictor does on first use: AutoBackend(fuse=True) keeps model.fuse()'s result.
+    predictor_model = detector.model.model.fuse()
+
+    assert fused == [net]  # the eager network was fused before it was compiled
+    assert predictor_model is detector.model.model
+    assert predictor_model(types.SimpleNamespace(shape=(1, 3, 640, 640))) == "compiled"
+
+
+def test_compile_model_falls_back_to_eager_when_first_run_fails(monkeypatch):
+    def broken_forward(x):
+        raise RuntimeError("inductor failed")
+
+    torch_stub, _ = _compile_torch_stub(broken_forward)
+    net = _PtNet()
+
+    class _PtModel(_FakeModel):
+        model = net
+
+    monkeypatch.setitem(sys.modules, "torch", torch_stub)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.gpu_tag", lambda: None)
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _PtModel())
+
+    detector = YOLODetector(model_path="weights.pt", plate_class_id=2, compile_model=True)
+
+    assert not detector.compiled
+    assert not detector.fused_preprocess
+    assert detector.model.model is net
+
+
+def test_detect_plate_can_skip_host_copy(monkeypatch, zero_image):
+    class _DeviceBoxes(_FakeBoxes):
+        def cpu(self):
+            raise AssertionError("boxes should stay on the device")
+
+    class _DeviceModel:
+        def __call__(self, image, classes=None):
+            result = _FakeResult(np.zeros((0, 4)), np.zeros(0))
+            result.boxes = _DeviceBoxes(np.array([[1, 2, 3, 4]], dtype=np.float32), np.array([0.0]))
+            return [result]
+
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _DeviceModel())
+    detector = YOLODetector(model_path="dummy", plate_class_id=0)
+    image = zero_image((10, 10, 3))
+
+    boxes = detector.detect_plate(image, return_device="cuda")
+    assert len(boxes) == 1
+    np.testing.assert_array_equal(boxes.xyxy, [[1, 2, 3, 4]])
+
+    with pytest.raises(ValueError):
+        detector.detect_plate(image, return_device="tpu")
+
+
+def test_box_batch_indexes_device_tensors_through_one_host_copy():
+    copies = []
+
+    class _DeviceTensor:
+        def __init__(self, array):
+            self.array = array
+
+        def __len__(self):
+            return len(self.array)
+
+        def cpu(self):
+            copies.append(self)
+            return types.SimpleNamespace(numpy=lambda: self.array)
+
+    batch = BoxBatch(
+        _DeviceTensor(np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.float32)),
+        _DeviceTensor(np.array([0.0, 2.0])),
+        _DeviceTensor(np.array([0.5, 0.9])),
+    )
+
+    boxes = list(batch)
+
+    _eq(boxes[1].xyxy[0], np.array([5, 6, 7, 8], dtype=np.float32))
+    assert boxes[1].cls == [2] and boxes[1].conf == [0.9]
+    assert len(copies) == 3  # one per field, not per index
+
+
+def test_detect_plate_copies_each_result_to_host_once(monkeypatch, zero_image):
+    copies = []
+
+    class _CountingBoxes(_FakeBoxes):
+        def cpu(self):
+            copies.append(len(self.xyxy))
+            return self
+
+    class _CrowdedModel:
+        def __call__(self, image, classes=None):
+            result = _FakeResult(np.zeros((0, 4)), np.zeros(0))
+            xyxy = np.arange(200 * 4, dtype=np.float32).reshape(200, 4)
+            result.boxes = _CountingBoxes(xyxy, np.zeros(200))
+            return [result]
+
+    monkeypatch.setattr("PlateProcessor.yolo_detector.YOLO", lambda path: _CrowdedModel())
+    detector = YOLODetector(model_path="dummy", plate_class_id=0)
+
+    boxes = detector.detect_plate(zero_image((10, 10, 3)))
+
+    assert copies == [200]
+    assert len(boxes) == 200 and boxes.xyxy.shape == (200, 4)